@@ -123,13 +123,13 @@ def _award_achievement_if_new(user, achievement_key, stat_value):
     subject = f"Achievement Unlocked: {achievement['title']}"
 
     # Check if already sent - handle case where duplicates exist
-    existing = EmailLog.objects.filter(
+    already_sent = EmailLog.objects.filter(
         user=user,
         email_type=EmailLog.EmailType.ACHIEVEMENT,
         subject=subject,
-    ).first()
+    ).exists()
 
-    if existing:
+    if already_sent:
         # Already sent
         return False
 
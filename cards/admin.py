@@ -16,9 +16,13 @@ class DeckAdmin(admin.ModelAdmin):
     search_fields = ['name', 'description']
     inlines = [CardInline]
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_counts()
+
     def card_count(self, obj):
-        return obj.cards.count()
+        return obj.card_count
     card_count.short_description = 'Cards'
+    card_count.admin_order_field = 'card_count'
 
 
 @admin.register(Card)
@@ -40,6 +44,9 @@ class ReviewLogAdmin(admin.ModelAdmin):
     readonly_fields = ['card', 'quality', 'ease_factor_before', 'ease_factor_after',
                        'interval_before', 'interval_after', 'reviewed_at']
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_card()
+
 
 @admin.register(ReviewReminder)
 class ReviewReminderAdmin(admin.ModelAdmin):
@@ -8,6 +8,7 @@ Cloze syntax:
 Multiple cloze deletions can exist in a single card.
 The number (c1, c2, etc.) groups related deletions.
 """
+import functools
 import re
 from dataclasses import dataclass
 
@@ -15,8 +16,16 @@ from dataclasses import dataclass
 # Pattern matches {{c1::text}} or {{c1::text::hint}}
 CLOZE_PATTERN = re.compile(r'\{\{c(\d+)::([^:}]+)(?:::([^}]+))?\}\}')
 
+# Anything wrapped in {{...}}, valid cloze or not (used to spot malformed ones)
+BRACED_PATTERN = re.compile(r'\{\{[^}]*\}\}')
 
-@dataclass(frozen=True)
+# Card fronts are parsed again on every review, preview and edit, so parsed
+# results are memoized per text. Cached values are immutable (tuples and
+# frozensets); the public functions hand out copies where callers expect lists.
+PARSE_CACHE_SIZE = 1024
+
+
+@dataclass(frozen=True, slots=True)
 class ClozeMatch:
     """Represents a single cloze deletion found in text."""
     full_match: str
@@ -27,28 +36,42 @@ class ClozeMatch:
     end: int
 
 
-def parse_cloze(text: str) -> list[ClozeMatch]:
-    """
-    Parse all cloze deletions from text.
-
-    Returns a list of ClozeMatch objects sorted by position.
-    """
-    matches = []
-    for match in CLOZE_PATTERN.finditer(text):
-        matches.append(ClozeMatch(
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_cloze(text: str) -> tuple[ClozeMatch, ...]:
+    return tuple(
+        ClozeMatch(
             full_match=match.group(0),
             number=int(match.group(1)),
             answer=match.group(2),
             hint=match.group(3),
             start=match.start(),
             end=match.end()
-        ))
-    return matches
+        )
+        for match in CLOZE_PATTERN.finditer(text)
+    )
 
 
-def get_cloze_numbers(text: str) -> set[int]:
+def parse_cloze(text: str) -> list[ClozeMatch]:
+    """
+    Parse all cloze deletions from text.
+
+    Returns a list of ClozeMatch objects sorted by position.
+    """
+    return list(_parse_cloze(text))
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def get_cloze_numbers(text: str) -> frozenset[int]:
     """Get all unique cloze numbers in the text."""
-    return {m.number for m in parse_cloze(text)}
+    # Read the number group straight off the matches; no ClozeMatch needed
+    return frozenset(int(match.group(1)) for match in CLOZE_PATTERN.finditer(text))
+
+
+def clear_caches() -> None:
+    """Drop memoized parse results."""
+    _parse_cloze.cache_clear()
+    get_cloze_numbers.cache_clear()
+    _validate_cloze_syntax.cache_clear()
 
 
 def render_cloze_question(text: str, active_number: int | None = None) -> str:
@@ -62,15 +85,13 @@ def render_cloze_question(text: str, active_number: int | None = None) -> str:
     and revealed text for inactive clozes.
     """
     def replace_cloze(match):
-        number = int(match.group(1))
-        answer = match.group(2)
-        hint = match.group(3)
-
         # If filtering by number and this isn't the active one, show the answer
-        if active_number is not None and number != active_number:
-            return answer
+        # (the number is only parsed when there is a filter to compare against)
+        if active_number is not None and int(match[1]) != active_number:
+            return match[2]
 
         # Show blank with optional hint
+        hint = match[3]
         if hint:
             return f'[{hint}]'
         return '[...]'
@@ -85,12 +106,15 @@ def render_cloze_answer(text: str, active_number: int | None = None) -> str:
     If active_number is specified, highlights that cloze group.
     Otherwise, all answers are shown normally.
     """
+    # Nothing to highlight: a template substitution keeps the loop in C
+    if active_number is None:
+        return CLOZE_PATTERN.sub(r'\2', text)
+
     def replace_cloze(match):
-        number = int(match.group(1))
-        answer = match.group(2)
+        answer = match[2]
 
         # Highlight active cloze, show others normally
-        if active_number is not None and number == active_number:
+        if int(match[1]) == active_number:
             return f'**{answer}**'
         return answer
 
@@ -99,24 +123,24 @@ def render_cloze_answer(text: str, active_number: int | None = None) -> str:
 
 def is_valid_cloze(text: str) -> bool:
     """Check if text contains at least one valid cloze deletion."""
-    return bool(CLOZE_PATTERN.search(text))
+    # Plain text can be rejected with a substring scan before touching the regex
+    return '{{c' in text and CLOZE_PATTERN.search(text) is not None
 
 
 def extract_cloze_answers(text: str) -> list[str]:
     """Extract all cloze answers from text."""
-    return [m.answer for m in parse_cloze(text)]
+    # Only the answer group is needed, so skip building ClozeMatch objects
+    return [match[2] for match in CLOZE_PATTERN.finditer(text)]
 
 
-def validate_cloze_syntax(text: str) -> list[str]:
-    """
-    Validate cloze syntax and return list of error messages.
-    Empty list means valid.
-    """
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _validate_cloze_syntax(text: str) -> tuple[str, ...]:
     errors = []
 
-    if not is_valid_cloze(text):
+    valid_count = len(CLOZE_PATTERN.findall(text))
+    if not valid_count:
         errors.append('No valid cloze deletions found. Use {{c1::text}} syntax.')
-        return errors
+        return tuple(errors)
 
     # Check for common mistakes
 
@@ -126,10 +150,21 @@ def validate_cloze_syntax(text: str) -> list[str]:
     if open_braces != close_braces:
         errors.append('Mismatched braces. Ensure each {{ has a matching }}.')
 
+    # Every {{ and }} belongs to a valid deletion, so none can be malformed
+    if open_braces == close_braces == valid_count:
+        return tuple(errors)
+
     # Check for malformed cloze (has {{ but doesn't match pattern)
-    potential_cloze = re.findall(r'\{\{[^}]*\}\}', text)
-    valid_cloze = CLOZE_PATTERN.findall(text)
-    if len(potential_cloze) > len(valid_cloze):
+    potential_cloze = BRACED_PATTERN.findall(text)
+    if len(potential_cloze) > valid_count:
         errors.append('Some cloze deletions are malformed. Use {{c1::text}} or {{c1::text::hint}} format.')
 
-    return errors
+    return tuple(errors)
+
+
+def validate_cloze_syntax(text: str) -> list[str]:
+    """
+    Validate cloze syntax and return list of error messages.
+    Empty list means valid.
+    """
+    return list(_validate_cloze_syntax(text))
@@ -8,6 +8,15 @@ from django.conf import settings
 from django.core.mail import EmailMultiAlternatives
 from django.template.loader import render_to_string
 
+from .models import EmailLog
+
+
+# Management commands write their EmailLog entries once this many have built
+# up. A command killed mid-run loses up to EMAIL_LOG_BATCH_SIZE - 1 unwritten
+# rows, and the dedup checks that read them will send those emails again on
+# the next run.
+EMAIL_LOG_BATCH_SIZE = 100
+
 
 # Color schemes for light and dark themes
 THEME_COLORS = {
@@ -211,3 +220,17 @@ def can_send_email(user, email_type):
     # Check specific email type
     pref_field = f'email_{email_type}'
     return getattr(prefs, pref_field, True)
+
+
+def flush_email_logs(email_logs, min_size=1):
+    """
+    Write pending EmailLog entries once at least `min_size` have built up.
+
+    The list is emptied before the INSERT, so a failed write surfaces once
+    instead of being retried by the command's final flush.
+    """
+    if not email_logs or len(email_logs) < min_size:
+        return
+    pending = email_logs[:]
+    email_logs.clear()
+    EmailLog.objects.bulk_create(pending)
@@ -1,3 +1,5 @@
+import functools
+
 from django import forms
 from django.contrib.auth.forms import UserCreationForm, AuthenticationForm
 from django.contrib.auth.models import User
@@ -6,46 +8,59 @@ from .models import Deck, Card, UserPreferences, ReviewReminder
 from . import cloze
 
 
+# Tailwind classes per widget kind, built once at import
+_BASE_CLASSES = (
+    "block w-full rounded-md border-gray-300 dark:border-gray-600 "
+    "bg-white dark:bg-gray-700 text-gray-900 dark:text-gray-100 "
+    "shadow-sm focus:border-primary-500 focus:ring-primary-500 "
+    "sm:text-sm px-3 py-2"
+)
+_CHECKBOX_CLASSES = (
+    "h-4 w-4 rounded border-gray-300 dark:border-gray-600 "
+    "text-primary-600 focus:ring-primary-500"
+)
+# Custom select styling with SVG chevron for consistent cross-browser appearance
+_SELECT_CLASSES = (
+    "block w-full rounded-md border-gray-300 dark:border-gray-600 "
+    "bg-white dark:bg-gray-700 text-gray-900 dark:text-gray-100 "
+    "shadow-sm focus:border-primary-500 focus:ring-primary-500 "
+    "sm:text-sm px-3 py-2 pr-10 appearance-none cursor-pointer "
+    "bg-no-repeat bg-[length:1.25rem_1.25rem] bg-[position:right_0.5rem_center] "
+    "bg-[url('data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20viewBox%3D%220%200%2020%2020%22%20fill%3D%22%236b7280%22%3E%3Cpath%20fill-rule%3D%22evenodd%22%20d%3D%22M5.23%207.21a.75.75%200%20011.06.02L10%2011.168l3.71-3.938a.75.75%200%20111.08%201.04l-4.25%204.5a.75.75%200%2001-1.08%200l-4.25-4.5a.75.75%200%2001.02-1.06z%22%20clip-rule%3D%22evenodd%22%2F%3E%3C%2Fsvg%3E')] "
+    "dark:bg-[url('data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20viewBox%3D%220%200%2020%2020%22%20fill%3D%22%239ca3af%22%3E%3Cpath%20fill-rule%3D%22evenodd%22%20d%3D%22M5.23%207.21a.75.75%200%20011.06.02L10%2011.168l3.71-3.938a.75.75%200%20111.08%201.04l-4.25%204.5a.75.75%200%2001-1.08%200l-4.25-4.5a.75.75%200%2001.02-1.06z%22%20clip-rule%3D%22evenodd%22%2F%3E%3C%2Fsvg%3E')]"
+)
+# Add dark color-scheme for native time/date picker icons
+_PICKER_CLASSES = _BASE_CLASSES + " dark:[color-scheme:dark]"
+
+# Checked in order, first match wins (same precedence as isinstance checks)
+_WIDGET_CLASSES = (
+    (forms.CheckboxInput, _CHECKBOX_CLASSES),
+    (forms.Select, _SELECT_CLASSES),
+    (forms.Textarea, _BASE_CLASSES),
+    (forms.TimeInput, _PICKER_CLASSES),
+    (forms.DateInput, _PICKER_CLASSES),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _classes_for_widget(widget_type):
+    """Resolve the class string for a widget type; cached per type."""
+    for base, classes in _WIDGET_CLASSES:
+        if issubclass(widget_type, base):
+            return classes
+    return _BASE_CLASSES
+
+
 class StyledFormMixin:
     """Mixin to add Tailwind CSS classes to form fields."""
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        for field_name, field in self.fields.items():
-            base_classes = (
-                "block w-full rounded-md border-gray-300 dark:border-gray-600 "
-                "bg-white dark:bg-gray-700 text-gray-900 dark:text-gray-100 "
-                "shadow-sm focus:border-primary-500 focus:ring-primary-500 "
-                "sm:text-sm px-3 py-2"
-            )
-            if isinstance(field.widget, forms.CheckboxInput):
-                field.widget.attrs['class'] = (
-                    "h-4 w-4 rounded border-gray-300 dark:border-gray-600 "
-                    "text-primary-600 focus:ring-primary-500"
-                )
-            elif isinstance(field.widget, forms.Select):
-                # Custom select styling with SVG chevron for consistent cross-browser appearance
-                select_classes = (
-                    "block w-full rounded-md border-gray-300 dark:border-gray-600 "
-                    "bg-white dark:bg-gray-700 text-gray-900 dark:text-gray-100 "
-                    "shadow-sm focus:border-primary-500 focus:ring-primary-500 "
-                    "sm:text-sm px-3 py-2 pr-10 appearance-none cursor-pointer "
-                    "bg-no-repeat bg-[length:1.25rem_1.25rem] bg-[position:right_0.5rem_center] "
-                    "bg-[url('data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20viewBox%3D%220%200%2020%2020%22%20fill%3D%22%236b7280%22%3E%3Cpath%20fill-rule%3D%22evenodd%22%20d%3D%22M5.23%207.21a.75.75%200%20011.06.02L10%2011.168l3.71-3.938a.75.75%200%20111.08%201.04l-4.25%204.5a.75.75%200%2001-1.08%200l-4.25-4.5a.75.75%200%2001.02-1.06z%22%20clip-rule%3D%22evenodd%22%2F%3E%3C%2Fsvg%3E')] "
-                    "dark:bg-[url('data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20viewBox%3D%220%200%2020%2020%22%20fill%3D%22%239ca3af%22%3E%3Cpath%20fill-rule%3D%22evenodd%22%20d%3D%22M5.23%207.21a.75.75%200%20011.06.02L10%2011.168l3.71-3.938a.75.75%200%20111.08%201.04l-4.25%204.5a.75.75%200%2001-1.08%200l-4.25-4.5a.75.75%200%2001.02-1.06z%22%20clip-rule%3D%22evenodd%22%2F%3E%3C%2Fsvg%3E')]"
-                )
-                field.widget.attrs['class'] = select_classes
-            elif isinstance(field.widget, forms.Textarea):
-                field.widget.attrs['class'] = base_classes
-                field.widget.attrs['rows'] = 3
-            elif isinstance(field.widget, forms.TimeInput):
-                # Add dark color-scheme for native time picker icons
-                field.widget.attrs['class'] = base_classes + " dark:[color-scheme:dark]"
-            elif isinstance(field.widget, forms.DateInput):
-                # Add dark color-scheme for native date picker icons
-                field.widget.attrs['class'] = base_classes + " dark:[color-scheme:dark]"
-            else:
-                field.widget.attrs['class'] = base_classes
+        for field in self.fields.values():
+            widget = field.widget
+            widget.attrs['class'] = _classes_for_widget(type(widget))
+            if isinstance(widget, forms.Textarea):
+                widget.attrs['rows'] = 3
 
 
 class LoginForm(StyledFormMixin, AuthenticationForm):
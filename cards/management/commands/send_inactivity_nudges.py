@@ -15,12 +15,17 @@ from django.core.management.base import BaseCommand
 from django.utils import timezone
 
 from cards.models import UserPreferences, Card, EmailLog
-from cards.email import send_branded_email, can_send_email
+from cards.email import (
+    send_branded_email, can_send_email, flush_email_logs, EMAIL_LOG_BATCH_SIZE,
+)
 
 
 # Number of days of inactivity before sending a nudge
 INACTIVITY_THRESHOLD_DAYS = 3
 
+# EmailLog type checked and written for each nudge
+EMAIL_TYPE = EmailLog.EmailType.INACTIVITY_NUDGE
+
 
 class Command(BaseCommand):
     help = 'Send inactivity nudge emails to users who haven\'t studied recently'
@@ -50,59 +55,65 @@ class Command(BaseCommand):
             last_study_date__isnull=False,
         ).select_related('user')
 
-        for prefs in users_with_history:
-            user = prefs.user
-
-            # Get user's local date for accurate comparison
-            user_tz = zoneinfo.ZoneInfo(prefs.user_timezone)
-            user_today = now.astimezone(user_tz).date()
-            threshold_date = user_today - timedelta(days=threshold_days)
-
-            # Check if user has been inactive (using their local timezone)
-            if prefs.last_study_date >= threshold_date:
-                # User has studied within threshold, skip
-                continue
-
-            # Check if user has email and is active
-            if not user.email or not user.is_active:
-                continue
-
-            # Check user email preferences
-            if not can_send_email(user, 'inactivity_nudge'):
-                self.stdout.write(f"Skipping {user.username}: email preferences disabled")
-                continue
-
-            # Check if already sent a nudge in the last 7 days
-            # (don't spam inactive users)
-            week_ago = now - timedelta(days=7)
-            recent_nudge = EmailLog.objects.filter(
-                user=user,
-                email_type=EmailLog.EmailType.INACTIVITY_NUDGE,
-                sent_at__gte=week_ago
-            ).exists()
-
-            if recent_nudge:
-                self.stdout.write(f"Skipping {user.username}: nudge sent recently")
-                continue
-
-            # Calculate days inactive (using user's local date)
-            days_inactive = (user_today - prefs.last_study_date).days
-
-            # Get cards due (excludes new cards that have never been reviewed)
-            cards_due = Card.objects.filter(
-                deck__owner=user,
-                next_review__lte=now,
-                has_been_reviewed=True
-            ).count()
-
-            if dry_run:
-                self.stdout.write(
-                    f"[DRY RUN] Would send to {user.email}: "
-                    f"{days_inactive} days inactive, {cards_due} cards due"
-                )
-            else:
-                self._send_inactivity_nudge(user, days_inactive, cards_due)
-                emails_sent += 1
+        email_logs = []
+        try:
+            for prefs in users_with_history:
+                user = prefs.user
+
+                # Get user's local date for accurate comparison
+                user_tz = zoneinfo.ZoneInfo(prefs.user_timezone)
+                user_today = now.astimezone(user_tz).date()
+                threshold_date = user_today - timedelta(days=threshold_days)
+
+                # Check if user has been inactive (using their local timezone)
+                if prefs.last_study_date >= threshold_date:
+                    # User has studied within threshold, skip
+                    continue
+
+                # Check if user has email and is active
+                if not user.email or not user.is_active:
+                    continue
+
+                # Check user email preferences
+                if not can_send_email(user, 'inactivity_nudge'):
+                    self.stdout.write(f"Skipping {user.username}: email preferences disabled")
+                    continue
+
+                # Check if already sent a nudge in the last 7 days
+                # (don't spam inactive users)
+                week_ago = now - timedelta(days=7)
+                recent_nudge = EmailLog.objects.filter(
+                    user=user,
+                    email_type=EMAIL_TYPE,
+                    sent_at__gte=week_ago
+                ).exists()
+
+                if recent_nudge:
+                    self.stdout.write(f"Skipping {user.username}: nudge sent recently")
+                    continue
+
+                # Calculate days inactive (using user's local date)
+                days_inactive = (user_today - prefs.last_study_date).days
+
+                # Get cards due (excludes new cards that have never been reviewed)
+                cards_due = Card.objects.filter(
+                    deck__owner=user,
+                    next_review__lte=now,
+                    has_been_reviewed=True
+                ).count()
+
+                if dry_run:
+                    self.stdout.write(
+                        f"[DRY RUN] Would send to {user.email}: "
+                        f"{days_inactive} days inactive, {cards_due} cards due"
+                    )
+                else:
+                    email_logs.append(self._send_inactivity_nudge(user, days_inactive, cards_due))
+                    flush_email_logs(email_logs, EMAIL_LOG_BATCH_SIZE)
+                    emails_sent += 1
+        finally:
+            # Write whatever is left of the last partial batch
+            flush_email_logs(email_logs)
 
         self.stdout.write(
             self.style.SUCCESS(f"Sent {emails_sent} inactivity nudge(s)")
@@ -130,11 +141,11 @@ class Command(BaseCommand):
             fail_silently=False,
         )
 
-        # Log the email
-        EmailLog.objects.create(
+        self.stdout.write(f"Sent inactivity nudge to {user.email}: {days_inactive} days inactive")
+
+        # Unsaved log entry; handle() writes them in bulk
+        return EmailLog(
             user=user,
-            email_type=EmailLog.EmailType.INACTIVITY_NUDGE,
+            email_type=EMAIL_TYPE,
             subject=subject,
         )
-
-        self.stdout.write(f"Sent inactivity nudge to {user.email}: {days_inactive} days inactive")
@@ -19,13 +19,18 @@ from django.core.management.base import BaseCommand
 from django.utils import timezone
 
 from cards.models import ReviewReminder, Card, EmailLog, CommandExecutionLog, UserPreferences
-from cards.email import send_branded_email, can_send_email
+from cards.email import (
+    send_branded_email, can_send_email, flush_email_logs, EMAIL_LOG_BATCH_SIZE,
+)
 
 logger = logging.getLogger(__name__)
 
 # Default time window in minutes (send if within this many minutes of preferred time)
 DEFAULT_TIME_WINDOW = 30
 
+# EmailLog type for study reminders (dedup key and log entries)
+EMAIL_TYPE = EmailLog.EmailType.STUDY_REMINDER
+
 
 class Command(BaseCommand):
     help = 'Send review reminder emails to users with cards due'
@@ -74,6 +79,7 @@ class Command(BaseCommand):
         reminders_sent = 0
         users_processed = 0
         errors = []
+        email_logs = []
         skipped_reasons = {
             'not_send_day': 0,
             'outside_time_window': 0,
@@ -87,95 +93,102 @@ class Command(BaseCommand):
             total_enabled = enabled_reminders.count()
             logger.info(f"Found {total_enabled} enabled reminders to process")
 
-            for reminder in enabled_reminders:
-                user = reminder.user
-                users_processed += 1
-
-                # Get user's timezone from preferences
-                prefs, _ = UserPreferences.objects.get_or_create(user=user)
-                user_tz = zoneinfo.ZoneInfo(prefs.user_timezone)
-                user_local_now = now.astimezone(user_tz)
-                user_current_day = user_local_now.weekday()  # 0 = Monday
-
-                # Check if should send today (using user's local day)
-                if not self._should_send_today(reminder, user_current_day):
-                    logger.info(
-                        f"Skipping {user.username}: not a send day "
-                        f"(frequency={reminder.frequency}, custom_days={reminder.custom_days}, today=weekday {user_current_day})"
-                    )
-                    skipped_reasons['not_send_day'] += 1
-                    continue
-
-                # Check if current time is within the preferred time window (using user's local time)
-                if not self._is_within_preferred_time(reminder, user_local_now, time_window):
-                    logger.info(
-                        f"Skipping {user.username}: outside time window "
-                        f"(preferred={reminder.preferred_time}, current={user_local_now.time()}, window=±{time_window}min)"
-                    )
-                    skipped_reasons['outside_time_window'] += 1
-                    continue
-
-                # Check user email preferences
-                if not can_send_email(user, 'study_reminders'):
-                    logger.info(f"Skipping {user.username}: email preferences disabled")
-                    self.stdout.write(f"Skipping {user.username}: email preferences disabled")
-                    skipped_reasons['email_prefs_disabled'] += 1
-                    continue
-
-                # Check if already sent today
-                if EmailLog.was_sent_today(user, EmailLog.EmailType.STUDY_REMINDER):
-                    logger.info(f"Skipping {user.username}: already sent today")
-                    self.stdout.write(f"Skipping {user.username}: already sent today")
-                    skipped_reasons['already_sent_today'] += 1
-                    continue
-
-                due_count = self._get_due_cards_count(user)
-
-                if due_count == 0:
-                    logger.info(f"Skipping {user.username}: no cards due")
-                    self.stdout.write(f"Skipping {user.username}: no cards due")
-                    skipped_reasons['no_cards_due'] += 1
-                    continue
-
-                # User is eligible for reminder
-                if dry_run:
-                    self.stdout.write(
-                        f"[DRY RUN] Would send to {user.email}: {due_count} cards due "
-                        f"(preferred time: {reminder.preferred_time})"
-                    )
-                    logger.info(
-                        f"[DRY RUN] Would send to {user.username}",
-                        extra={'email': user.email, 'due_count': due_count}
-                    )
-                else:
-                    try:
-                        self._send_reminder_email(user, due_count)
-                        reminder.last_sent = now
-                        reminder.save()
-                        reminders_sent += 1
+            try:
+                for reminder in enabled_reminders:
+                    user = reminder.user
+                    users_processed += 1
+
+                    # Get user's timezone from preferences
+                    prefs, _ = UserPreferences.objects.get_or_create(user=user)
+                    user_tz = zoneinfo.ZoneInfo(prefs.user_timezone)
+                    user_local_now = now.astimezone(user_tz)
+                    user_current_day = user_local_now.weekday()  # 0 = Monday
+
+                    # Check if should send today (using user's local day)
+                    if not self._should_send_today(reminder, user_current_day):
                         logger.info(
-                            f"Sent reminder to {user.username}",
-                            extra={
-                                'email': user.email,
-                                'due_count': due_count,
-                                'preferred_time': str(reminder.preferred_time),
-                            }
+                            f"Skipping {user.username}: not a send day "
+                            f"(frequency={reminder.frequency}, custom_days={reminder.custom_days}, today=weekday {user_current_day})"
+                        )
+                        skipped_reasons['not_send_day'] += 1
+                        continue
+
+                    # Check if current time is within the preferred time window (using user's local time)
+                    if not self._is_within_preferred_time(reminder, user_local_now, time_window):
+                        logger.info(
+                            f"Skipping {user.username}: outside time window "
+                            f"(preferred={reminder.preferred_time}, current={user_local_now.time()}, window=±{time_window}min)"
                         )
-                        self.stdout.write(f"Sent reminder to {user.email}: {due_count} cards due")
-                    except Exception as e:
-                        error_msg = f"Failed to send email to {user.username}: {str(e)}"
-                        errors.append({
-                            'user': user.username,
-                            'email': user.email,
-                            'error': str(e),
-                            'traceback': traceback.format_exc(),
-                        })
-                        logger.error(
-                            error_msg,
-                            extra={'traceback': traceback.format_exc()},
-                            exc_info=True
+                        skipped_reasons['outside_time_window'] += 1
+                        continue
+
+                    # Check user email preferences
+                    if not can_send_email(user, 'study_reminders'):
+                        logger.info(f"Skipping {user.username}: email preferences disabled")
+                        self.stdout.write(f"Skipping {user.username}: email preferences disabled")
+                        skipped_reasons['email_prefs_disabled'] += 1
+                        continue
+
+                    # Check if already sent today
+                    if EmailLog.was_sent_today(user, EMAIL_TYPE):
+                        logger.info(f"Skipping {user.username}: already sent today")
+                        self.stdout.write(f"Skipping {user.username}: already sent today")
+                        skipped_reasons['already_sent_today'] += 1
+                        continue
+
+                    due_count = self._get_due_cards_count(user)
+
+                    if due_count == 0:
+                        logger.info(f"Skipping {user.username}: no cards due")
+                        self.stdout.write(f"Skipping {user.username}: no cards due")
+                        skipped_reasons['no_cards_due'] += 1
+                        continue
+
+                    # User is eligible for reminder
+                    if dry_run:
+                        self.stdout.write(
+                            f"[DRY RUN] Would send to {user.email}: {due_count} cards due "
+                            f"(preferred time: {reminder.preferred_time})"
                         )
-                        self.stderr.write(self.style.ERROR(error_msg))
+                        logger.info(
+                            f"[DRY RUN] Would send to {user.username}",
+                            extra={'email': user.email, 'due_count': due_count}
+                        )
+                    else:
+                        try:
+                            email_logs.append(self._send_reminder_email(user, due_count))
+                            reminder.last_sent = now
+                            reminder.save()
+                            reminders_sent += 1
+                            logger.info(
+                                f"Sent reminder to {user.username}",
+                                extra={
+                                    'email': user.email,
+                                    'due_count': due_count,
+                                    'preferred_time': str(reminder.preferred_time),
+                                }
+                            )
+                            self.stdout.write(f"Sent reminder to {user.email}: {due_count} cards due")
+                        except Exception as e:
+                            error_msg = f"Failed to send email to {user.username}: {str(e)}"
+                            errors.append({
+                                'user': user.username,
+                                'email': user.email,
+                                'error': str(e),
+                                'traceback': traceback.format_exc(),
+                            })
+                            logger.error(
+                                error_msg,
+                                extra={'traceback': traceback.format_exc()},
+                                exc_info=True
+                            )
+                            self.stderr.write(self.style.ERROR(error_msg))
+
+                        # Outside the per-send try: a failed log write isn't a failed send
+                        flush_email_logs(email_logs, EMAIL_LOG_BATCH_SIZE)
+            finally:
+                # Write whatever is left of the last partial batch
+                flush_email_logs(email_logs)
 
             # Log completion
             summary = {
@@ -321,9 +334,9 @@ class Command(BaseCommand):
             fail_silently=False,
         )
 
-        # Log the email
-        EmailLog.objects.create(
+        # Unsaved log entry; handle() writes them in bulk
+        return EmailLog(
             user=user,
-            email_type=EmailLog.EmailType.STUDY_REMINDER,
+            email_type=EMAIL_TYPE,
             subject=subject,
         )
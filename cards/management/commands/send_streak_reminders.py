@@ -18,7 +18,12 @@ from django.core.management.base import BaseCommand
 from django.utils import timezone
 
 from cards.models import UserPreferences, Card, EmailLog
-from cards.email import send_branded_email, can_send_email
+from cards.email import (
+    send_branded_email, can_send_email, flush_email_logs, EMAIL_LOG_BATCH_SIZE,
+)
+
+# Log type used for the once-a-day dedup check
+EMAIL_TYPE = EmailLog.EmailType.STREAK_REMINDER
 
 
 class Command(BaseCommand):
@@ -33,43 +38,54 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         dry_run = options['dry_run']
+        now = timezone.now()
         reminders_sent = 0
+        # Local date per timezone name, shared by every user in that zone
+        local_dates = {}
 
         # Find users with active streaks
         users_at_risk = UserPreferences.objects.filter(
             current_streak__gt=0,
         ).select_related('user')
 
-        for prefs in users_at_risk:
-            user = prefs.user
-
-            # Check if user has studied today (using their local timezone)
-            user_today = prefs.get_local_date()
-            if prefs.last_study_date == user_today:
-                # Already studied today, no reminder needed
-                continue
-
-            # Check if user has email and is active
-            if not user.email or not user.is_active:
-                continue
-
-            # Check user email preferences
-            if not can_send_email(user, 'streak_reminders'):
-                self.stdout.write(f"Skipping {user.username}: email preferences disabled")
-                continue
-
-            # Check if already sent today
-            if EmailLog.was_sent_today(user, EmailLog.EmailType.STREAK_REMINDER):
-                self.stdout.write(f"Skipping {user.username}: already sent today")
-                continue
-
-            if dry_run:
-                self.stdout.write(
-                    f"[DRY RUN] Would send to {user.email}: {prefs.current_streak}-day streak at risk"
-                )
-            else:
-                self._send_streak_reminder(user, prefs)
-                reminders_sent += 1
+        email_logs = []
+        try:
+            for prefs in users_at_risk:
+                user = prefs.user
+
+                # Check if user has studied today (using their local timezone)
+                user_today = local_dates.get(prefs.user_timezone)
+                if user_today is None:
+                    user_today = local_dates[prefs.user_timezone] = prefs.get_local_date(now)
+                if not prefs.check_streak_at_risk(today=user_today):
+                    # Already studied today, no reminder needed
+                    continue
+
+                # Check if user has email and is active
+                if not user.email or not user.is_active:
+                    continue
+
+                # Check user email preferences
+                if not can_send_email(user, 'streak_reminders'):
+                    self.stdout.write(f"Skipping {user.username}: email preferences disabled")
+                    continue
+
+                # Check if already sent today
+                if EmailLog.was_sent_today(user, EMAIL_TYPE):
+                    self.stdout.write(f"Skipping {user.username}: already sent today")
+                    continue
+
+                if dry_run:
+                    self.stdout.write(
+                        f"[DRY RUN] Would send to {user.email}: {prefs.current_streak}-day streak at risk"
+                    )
+                else:
+                    email_logs.append(self._send_streak_reminder(user, prefs))
+                    flush_email_logs(email_logs, EMAIL_LOG_BATCH_SIZE)
+                    reminders_sent += 1
+        finally:
+            # Write whatever is left of the last partial batch
+            flush_email_logs(email_logs)
 
         self.stdout.write(
             self.style.SUCCESS(f"Sent {reminders_sent} streak reminder(s)")
@@ -104,11 +120,11 @@ class Command(BaseCommand):
             fail_silently=False,
         )
 
-        # Log the email
-        EmailLog.objects.create(
+        self.stdout.write(f"Sent streak reminder to {user.email}: {prefs.current_streak}-day streak")
+
+        # Unsaved log entry; handle() writes them in bulk
+        return EmailLog(
             user=user,
-            email_type=EmailLog.EmailType.STREAK_REMINDER,
+            email_type=EMAIL_TYPE,
             subject=subject,
         )
-
-        self.stdout.write(f"Sent streak reminder to {user.email}: {prefs.current_streak}-day streak")
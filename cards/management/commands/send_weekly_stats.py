@@ -16,7 +16,12 @@ from django.db.models import Avg, Count
 from django.utils import timezone
 
 from cards.models import UserPreferences, Card, ReviewLog, Deck, EmailLog
-from cards.email import send_branded_email, can_send_email
+from cards.email import (
+    send_branded_email, can_send_email, flush_email_logs, EMAIL_LOG_BATCH_SIZE,
+)
+
+# Log type used for the once-a-week dedup check
+EMAIL_TYPE = EmailLog.EmailType.WEEKLY_STATS
 
 
 class Command(BaseCommand):
@@ -34,48 +39,54 @@ class Command(BaseCommand):
         now = timezone.now()
         emails_sent = 0
 
-        # Get all users with preferences
-        for prefs in UserPreferences.objects.select_related('user').all():
-            user = prefs.user
-
-            # Check if user has email and is active
-            if not user.email or not user.is_active:
-                continue
-
-            # Check user email preferences
-            if not can_send_email(user, 'weekly_stats'):
-                self.stdout.write(f"Skipping {user.username}: email preferences disabled")
-                continue
-
-            # Check if already sent this week
-            if EmailLog.was_sent_this_week(user, EmailLog.EmailType.WEEKLY_STATS):
-                self.stdout.write(f"Skipping {user.username}: already sent this week")
-                continue
-
-            # Calculate date ranges using user's timezone
-            user_tz = zoneinfo.ZoneInfo(prefs.user_timezone)
-            user_today = now.astimezone(user_tz).date()
-            week_end = user_today
-            week_start = week_end - timedelta(days=7)
-            prev_week_end = week_start
-            prev_week_start = prev_week_end - timedelta(days=7)
-
-            # Gather statistics
-            stats = self._gather_stats(user, prefs, week_start, week_end, prev_week_start, prev_week_end)
-
-            # Skip if no activity at all
-            if stats['cards_reviewed'] == 0 and stats['cards_reviewed_last_week'] == 0:
-                self.stdout.write(f"Skipping {user.username}: no activity")
-                continue
-
-            if dry_run:
-                self.stdout.write(
-                    f"[DRY RUN] Would send to {user.email}: "
-                    f"{stats['cards_reviewed']} cards reviewed this week"
-                )
-            else:
-                self._send_weekly_stats(user, prefs, stats, week_start, week_end)
-                emails_sent += 1
+        email_logs = []
+        try:
+            # Get all users with preferences
+            for prefs in UserPreferences.objects.select_related('user').all():
+                user = prefs.user
+
+                # Check if user has email and is active
+                if not user.email or not user.is_active:
+                    continue
+
+                # Check user email preferences
+                if not can_send_email(user, 'weekly_stats'):
+                    self.stdout.write(f"Skipping {user.username}: email preferences disabled")
+                    continue
+
+                # Check if already sent this week
+                if EmailLog.was_sent_this_week(user, EMAIL_TYPE):
+                    self.stdout.write(f"Skipping {user.username}: already sent this week")
+                    continue
+
+                # Calculate date ranges using user's timezone
+                user_tz = zoneinfo.ZoneInfo(prefs.user_timezone)
+                user_today = now.astimezone(user_tz).date()
+                week_end = user_today
+                week_start = week_end - timedelta(days=7)
+                prev_week_end = week_start
+                prev_week_start = prev_week_end - timedelta(days=7)
+
+                # Gather statistics
+                stats = self._gather_stats(user, prefs, week_start, week_end, prev_week_start, prev_week_end)
+
+                # Skip if no activity at all
+                if stats['cards_reviewed'] == 0 and stats['cards_reviewed_last_week'] == 0:
+                    self.stdout.write(f"Skipping {user.username}: no activity")
+                    continue
+
+                if dry_run:
+                    self.stdout.write(
+                        f"[DRY RUN] Would send to {user.email}: "
+                        f"{stats['cards_reviewed']} cards reviewed this week"
+                    )
+                else:
+                    email_logs.append(self._send_weekly_stats(user, prefs, stats, week_start, week_end))
+                    flush_email_logs(email_logs, EMAIL_LOG_BATCH_SIZE)
+                    emails_sent += 1
+        finally:
+            # Write whatever is left of the last partial batch
+            flush_email_logs(email_logs)
 
         self.stdout.write(
             self.style.SUCCESS(f"Sent {emails_sent} weekly stats email(s)")
@@ -176,11 +187,11 @@ class Command(BaseCommand):
             fail_silently=False,
         )
 
-        # Log the email
-        EmailLog.objects.create(
+        self.stdout.write(f"Sent weekly stats to {user.email}")
+
+        # Unsaved log entry; handle() writes them in bulk
+        return EmailLog(
             user=user,
-            email_type=EmailLog.EmailType.WEEKLY_STATS,
+            email_type=EMAIL_TYPE,
             subject=subject,
         )
-
-        self.stdout.write(f"Sent weekly stats to {user.email}")
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 11:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cards', '0012_anki_style_card_limits'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='card',
+            index=models.Index(fields=['deck', 'has_been_reviewed', 'next_review'], name='cards_card_deck_id_3fcf63_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-16 11:54
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cards', '0013_card_due_index'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='commandexecutionlog',
+            options={},
+        ),
+        migrations.AlterModelOptions(
+            name='emaillog',
+            options={},
+        ),
+    ]
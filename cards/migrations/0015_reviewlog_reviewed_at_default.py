@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-16 11:57
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cards', '0014_remove_log_default_ordering'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='reviewlog',
+            name='reviewed_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
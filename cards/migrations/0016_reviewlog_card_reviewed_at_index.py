@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 12:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cards', '0015_reviewlog_reviewed_at_default'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='reviewlog',
+            index=models.Index(fields=['card', 'reviewed_at'], name='cards_revie_card_id_bf3902_idx'),
+        ),
+    ]
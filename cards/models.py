@@ -1,10 +1,14 @@
+import functools
 import secrets
 import uuid
 import zoneinfo
+from datetime import datetime, time
 
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Count, Q
 from django.contrib.auth.models import User
 from django.utils import timezone
+from django.utils.functional import cached_property
 
 from . import srs
 
@@ -37,6 +41,36 @@ TIMEZONE_CHOICES = [
 ]
 
 
+@functools.lru_cache(maxsize=1)
+def _day_start(day, tz):
+    """Aware midnight for a date; cached so a batch run reuses one object."""
+    return datetime.combine(day, time.min, tzinfo=tz)
+
+
+def _today_start():
+    """Start of the current day in the active timezone."""
+    return _day_start(timezone.localdate(), timezone.get_current_timezone())
+
+
+# Rows per statement for Card.review_batch()
+REVIEW_BATCH_SIZE = 500
+
+
+class DeckQuerySet(models.QuerySet):
+    def with_counts(self, now=None):
+        """Annotate card_count, due_count and new_count in the same query."""
+        if now is None:
+            now = timezone.now()
+        return self.annotate(
+            card_count=Count('cards'),
+            due_count=Count('cards', filter=Q(
+                cards__next_review__lte=now,
+                cards__has_been_reviewed=True  # Exclude new cards
+            )),
+            new_count=Count('cards', filter=Q(cards__has_been_reviewed=False))
+        )
+
+
 class Deck(models.Model):
     """A collection of flashcards."""
     name = models.CharField(max_length=200)
@@ -45,6 +79,8 @@ class Deck(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = DeckQuerySet.as_manager()
+
     class Meta:
         ordering = ['name']
         unique_together = ['name', 'owner']
@@ -52,15 +88,25 @@ class Deck(models.Model):
     def __str__(self):
         return self.name
 
+    # Counts are cached on the instance for its lifetime (usually one request).
+    # After changing this deck's cards, `del deck.cards_due_count` to refresh.
+    # Decks loaded via Deck.objects.with_counts() reuse the annotations.
+
+    @cached_property
     def cards_due_count(self):
-        """Return count of cards due for review (excludes new cards)."""
+        """Count of cards due for review (excludes new cards)."""
+        if hasattr(self, 'due_count'):
+            return self.due_count
         return self.cards.filter(
             next_review__lte=timezone.now(),
             has_been_reviewed=True  # Exclude new cards (never reviewed)
         ).count()
 
+    @cached_property
     def cards_new_count(self):
-        """Return count of new cards (never reviewed)."""
+        """Count of new cards (never reviewed)."""
+        if hasattr(self, 'new_count'):
+            return self.new_count
         return self.cards.filter(has_been_reviewed=False).count()
 
 
@@ -96,13 +142,30 @@ class Card(models.Model):
 
     class Meta:
         ordering = ['next_review']
+        indexes = [
+            # Covers the due (has_been_reviewed=True, next_review<=now) and
+            # new (has_been_reviewed=False) filters used per deck and per user
+            models.Index(fields=['deck', 'has_been_reviewed', 'next_review']),
+        ]
 
     def __str__(self):
         return f"{self.front[:50]}..."
 
-    def is_due(self):
-        """Check if card is due for review (excludes new cards)."""
-        return self.repetitions > 0 and self.next_review <= timezone.now()
+    def is_due(self, now=None):
+        """
+        Check if card is due for review (excludes new cards).
+
+        Pass `now` when checking many cards so they share one timestamp.
+        """
+        if now is None:
+            now = timezone.now()
+        return self.has_been_reviewed and self.next_review <= now
+
+    # Columns a review writes; nothing else on the card changes
+    SCHEDULING_FIELDS = [
+        'ease_factor', 'interval', 'repetitions', 'next_review',
+        'last_reviewed', 'has_been_reviewed', 'updated_at',
+    ]
 
     def review(self, quality):
         """
@@ -118,6 +181,35 @@ class Card(models.Model):
 
         Returns the ReviewLog entry created.
         """
+        log = self._schedule(quality, timezone.now())
+        with transaction.atomic():
+            self.save(update_fields=self.SCHEDULING_FIELDS)
+            log.save()
+        return log
+
+    @classmethod
+    def review_batch(cls, quality_by_card):
+        """
+        Review several cards at once.
+
+        quality_by_card maps card pk to a quality rating (0-5). Cards are
+        loaded in one query and written back with one bulk UPDATE and one
+        bulk INSERT. Unknown pks are ignored.
+
+        Returns the ReviewLog entries created.
+        """
+        now = timezone.now()
+        cards = cls.objects.in_bulk(quality_by_card)
+        logs = [card._schedule(quality_by_card[pk], now) for pk, card in cards.items()]
+        with transaction.atomic():
+            cls.objects.bulk_update(
+                cards.values(), cls.SCHEDULING_FIELDS, batch_size=REVIEW_BATCH_SIZE
+            )
+            ReviewLog.objects.bulk_create(logs, batch_size=REVIEW_BATCH_SIZE)
+        return logs
+
+    def _schedule(self, quality, now):
+        """Apply a review to this instance and return its unsaved ReviewLog."""
         # Store current state for logging
         ease_before = self.ease_factor
         interval_before = self.interval
@@ -128,29 +220,36 @@ class Card(models.Model):
             current_interval=self.interval,
             repetitions=self.repetitions,
             quality=quality,
-            review_time=timezone.now()
+            review_time=now
         )
 
-        # Update card state
+        # Update card state (bulk_update skips auto_now, so set it here)
         self.ease_factor = result.ease_factor
         self.interval = result.interval
         self.repetitions = result.repetitions
         self.next_review = result.next_review
-        self.last_reviewed = timezone.now()
+        self.last_reviewed = now
         self.has_been_reviewed = True
-        self.save()
+        self.updated_at = now
 
-        # Create review log
-        return ReviewLog.objects.create(
+        # One timestamp for the whole review so card and log agree
+        return ReviewLog(
             card=self,
             quality=quality,
             ease_factor_before=ease_before,
             ease_factor_after=result.ease_factor,
             interval_before=interval_before,
-            interval_after=result.interval
+            interval_after=result.interval,
+            reviewed_at=now
         )
 
 
+class ReviewLogQuerySet(models.QuerySet):
+    def with_card(self):
+        """Fetch each log's card and deck in the same query."""
+        return self.select_related('card__deck')
+
+
 class ReviewLog(models.Model):
     """Log of card reviews for analytics."""
     card = models.ForeignKey(Card, on_delete=models.CASCADE, related_name='review_logs')
@@ -159,10 +258,17 @@ class ReviewLog(models.Model):
     ease_factor_after = models.FloatField()
     interval_before = models.IntegerField()
     interval_after = models.IntegerField()
-    reviewed_at = models.DateTimeField(auto_now_add=True)
+    reviewed_at = models.DateTimeField(default=timezone.now)
+
+    objects = ReviewLogQuerySet.as_manager()
 
     class Meta:
         ordering = ['-reviewed_at']
+        indexes = [
+            # Per-card date ranges: the user's logs are reached through their
+            # cards, then narrowed to today/this week/this month
+            models.Index(fields=['card', 'reviewed_at']),
+        ]
 
 
 class ReviewReminder(models.Model):
@@ -255,14 +361,23 @@ class UserPreferences(models.Model):
     def __str__(self):
         return f"Preferences for {self.user.username}"
 
-    def get_local_date(self):
-        """Get the current date in the user's timezone."""
+    def get_local_date(self, now=None):
+        """Get the current date in the user's timezone.
+
+        Pass ``now`` to reuse one timestamp across many users in a batch.
+        """
+        if now is None:
+            now = timezone.now()
         user_tz = zoneinfo.ZoneInfo(self.user_timezone)
-        return timezone.now().astimezone(user_tz).date()
+        return now.astimezone(user_tz).date()
 
-    def update_streak(self):
-        """Update streak based on current date and last study date."""
-        today = self.get_local_date()
+    def update_streak(self, today=None):
+        """Update streak based on current date and last study date.
+
+        ``today`` is the user's local date; computed when not given.
+        """
+        if today is None:
+            today = self.get_local_date()
 
         if self.last_study_date is None:
             # First study session
@@ -286,12 +401,13 @@ class UserPreferences(models.Model):
 
         self.save()
 
-    def check_streak_at_risk(self):
+    def check_streak_at_risk(self, today=None):
         """Check if user's streak is at risk (hasn't studied today)."""
         if self.current_streak == 0:
             return False
 
-        today = self.get_local_date()
+        if today is None:
+            today = self.get_local_date()
         return self.last_study_date != today
 
 
@@ -308,9 +424,13 @@ class EmailVerificationToken(models.Model):
     @classmethod
     def create_for_user(cls, user):
         """Create a new verification token for a user, replacing any existing one."""
-        cls.objects.filter(user=user).delete()
-        token = secrets.token_urlsafe(32)
-        return cls.objects.create(user=user, token=token)
+        # Reuse the existing row (one UPDATE) rather than DELETE + INSERT;
+        # created_at is reset explicitly since auto_now_add only applies on insert
+        verification, _ = cls.objects.update_or_create(
+            user=user,
+            defaults={'token': secrets.token_urlsafe(32), 'created_at': timezone.now()},
+        )
+        return verification
 
     def is_expired(self):
         """Check if the token has expired (24 hours)."""
@@ -335,7 +455,8 @@ class EmailLog(models.Model):
     sent_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
-        ordering = ['-sent_at']
+        # No default ordering: the dedup probes are EXISTS checks and
+        # shouldn't pay for a sort. Order explicitly where it matters.
         indexes = [
             models.Index(fields=['user', 'email_type', 'sent_at']),
         ]
@@ -346,11 +467,10 @@ class EmailLog(models.Model):
     @classmethod
     def was_sent_today(cls, user, email_type):
         """Check if this email type was already sent to user today."""
-        today_start = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
         return cls.objects.filter(
             user=user,
             email_type=email_type,
-            sent_at__gte=today_start
+            sent_at__gte=_today_start()
         ).exists()
 
     @classmethod
@@ -384,7 +504,6 @@ class CommandExecutionLog(models.Model):
     details = models.JSONField(default=dict, blank=True)
 
     class Meta:
-        ordering = ['-started_at']
         indexes = [
             models.Index(fields=['command_name', 'started_at']),
         ]
@@ -424,7 +543,7 @@ class CommandExecutionLog(models.Model):
     @classmethod
     def get_last_run(cls, command_name):
         """Get the most recent execution of a command."""
-        return cls.objects.filter(command_name=command_name).first()
+        return cls.objects.filter(command_name=command_name).order_by('-started_at').first()
 
     @classmethod
     def get_last_success(cls, command_name):
@@ -432,4 +551,4 @@ class CommandExecutionLog(models.Model):
         return cls.objects.filter(
             command_name=command_name,
             status=cls.Status.SUCCESS
-        ).first()
+        ).order_by('-started_at').first()
@@ -0,0 +1,16 @@
+"""Signal handlers for the cards app."""
+
+from django.contrib.auth.models import User
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import UserPreferences
+
+
+@receiver(post_save, sender=User)
+def create_user_preferences(sender, instance, created, **kwargs):
+    """Give every new user a preferences row with the defaults."""
+    # Only on insert: User is saved again on every login (last_login).
+    # Skip fixture loads, which bring their own preferences rows.
+    if created and not kwargs.get('raw'):
+        UserPreferences.objects.get_or_create(user=instance)
@@ -28,7 +28,7 @@ FIRST_INTERVAL = 1         # First successful review: 1 day
 SECOND_INTERVAL = 6        # Second successful review: 6 days
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReviewResult:
     """Immutable result of a review calculation."""
     ease_factor: float
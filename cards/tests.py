@@ -2,26 +2,66 @@
 Unit tests for the flashcard application.
 
 Test organization:
-- SRSTests: Pure function tests for the SM-2 algorithm
-- ClozeTests: Pure function tests for cloze parsing/rendering
+- SRSTests: Pure function tests for the SM-2 algorithm (SimpleTestCase, no DB)
+- ClozeTests: Pure function tests for cloze parsing/rendering (SimpleTestCase, no DB)
 - ModelTests: Django model tests for Card, Deck, ReviewLog
 """
 
-from datetime import datetime, timedelta, timezone as dt_timezone
-from django.test import TestCase
+import json
+import random
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+from django.test import SimpleTestCase, TestCase, TransactionTestCase
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
+from django.core import serializers
 from django.utils import timezone
 
 from . import srs
 from . import cloze
-from .models import Deck, Card, ReviewLog
+from .models import (
+    Deck, Card, ReviewLog, ReviewReminder, UserPreferences,
+    EmailVerificationToken, EmailLog, CommandExecutionLog,
+)
+
+
+# Every fixture user shares one password, hashed once at import instead of
+# once per create_user() call
+TEST_PASSWORD = 'testpass123'
+_TEST_PASSWORD_HASH = make_password(TEST_PASSWORD)
+
+
+def create_test_user(username='testuser', **fields):
+    """Create a user whose password is TEST_PASSWORD."""
+    return User.objects.create(username=username, password=_TEST_PASSWORD_HASH, **fields)
+
+
+class LoggedInUserMixin:
+    """Creates cls.user once per class and logs it in for every test."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.user = create_test_user()
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.user)
+
+
+class LoggedInDeckMixin(LoggedInUserMixin):
+    """LoggedInUserMixin plus an empty cls.deck owned by the user."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.deck = Deck.objects.create(name='Test Deck', owner=cls.user)
 
 
 # =============================================================================
 # SRS Algorithm Tests
 # =============================================================================
 
-class SRSEaseFactorTests(TestCase):
+class SRSEaseFactorTests(SimpleTestCase):
     """Tests for ease factor calculation."""
 
     def test_perfect_response_increases_ease(self):
@@ -65,7 +105,7 @@ class SRSEaseFactorTests(TestCase):
         self.assertAlmostEqual(new_ease, 1.7, places=2)
 
 
-class SRSIntervalTests(TestCase):
+class SRSIntervalTests(SimpleTestCase):
     """Tests for interval calculation."""
 
     def test_first_successful_review(self):
@@ -109,7 +149,7 @@ class SRSIntervalTests(TestCase):
         self.assertEqual(reps, 1)  # Should increment
 
 
-class SRSCalculateReviewTests(TestCase):
+class SRSCalculateReviewTests(SimpleTestCase):
     """Integration tests for the main calculate_review function."""
 
     def test_returns_review_result(self):
@@ -118,7 +158,8 @@ class SRSCalculateReviewTests(TestCase):
             current_ease=2.5,
             current_interval=0,
             repetitions=0,
-            quality=4
+            quality=4,
+            review_time=datetime(2025, 1, 15, 12, 0, 0)
         )
         self.assertIsInstance(result, srs.ReviewResult)
         self.assertIsInstance(result.ease_factor, float)
@@ -151,28 +192,54 @@ class SRSCalculateReviewTests(TestCase):
         ease = 2.5
         interval = 0
         reps = 0
+        # One fixed clock for the whole walk instead of reading the time per call
+        review_time = datetime(2025, 1, 15, 12, 0, 0)
 
         # First review - quality 4
-        result = srs.calculate_review(ease, interval, reps, quality=4)
+        result = srs.calculate_review(ease, interval, reps, quality=4, review_time=review_time)
         self.assertEqual(result.interval, 1)
         self.assertEqual(result.repetitions, 1)
 
         # Second review - quality 4
         result = srs.calculate_review(
-            result.ease_factor, result.interval, result.repetitions, quality=4
+            result.ease_factor, result.interval, result.repetitions, quality=4,
+            review_time=review_time
         )
         self.assertEqual(result.interval, 6)
         self.assertEqual(result.repetitions, 2)
 
         # Third review - quality 4
         result = srs.calculate_review(
-            result.ease_factor, result.interval, result.repetitions, quality=4
+            result.ease_factor, result.interval, result.repetitions, quality=4,
+            review_time=review_time
         )
         self.assertGreater(result.interval, 6)
         self.assertEqual(result.repetitions, 3)
+        self.assertEqual(result.next_review, review_time + timedelta(days=result.interval))
+
+    def test_random_review_sequences_keep_invariants(self):
+        """Any sequence of ratings keeps the scheduling state consistent."""
+        rng = random.Random(1234)  # Seeded so failures are reproducible
+        review_time = datetime(2025, 1, 1, 12, 0, 0)
 
+        for _ in range(200):
+            ease, interval, reps = srs.DEFAULT_EASE_FACTOR, 0, 0
+            for quality in (rng.randint(0, 5) for _ in range(rng.randint(1, 15))):
+                result = srs.calculate_review(ease, interval, reps, quality, review_time)
 
-class SRSEstimateRetentionTests(TestCase):
+                self.assertGreaterEqual(result.ease_factor, srs.MIN_EASE_FACTOR)
+                self.assertGreaterEqual(result.interval, 1)
+                self.assertEqual(result.next_review, review_time + timedelta(days=result.interval))
+                if quality < 3:
+                    self.assertEqual((result.interval, result.repetitions), (1, 0))
+                else:
+                    self.assertEqual(result.repetitions, reps + 1)
+                    self.assertGreaterEqual(result.interval, interval)
+
+                ease, interval, reps = result.ease_factor, result.interval, result.repetitions
+
+
+class SRSEstimateRetentionTests(SimpleTestCase):
     """Tests for retention estimation."""
 
     def test_retention_in_valid_range(self):
@@ -192,9 +259,15 @@ class SRSEstimateRetentionTests(TestCase):
 # Cloze Module Tests
 # =============================================================================
 
-class ClozeParseTests(TestCase):
+class ClozeParseTests(SimpleTestCase):
     """Tests for cloze parsing."""
 
+    def test_parse_returns_fresh_list(self):
+        """Mutating a parse result doesn't leak into the cache."""
+        text = "{{c1::A}} {{c2::B}}"
+        cloze.parse_cloze(text).clear()
+        self.assertEqual(len(cloze.parse_cloze(text)), 2)
+
     def test_parse_simple_cloze(self):
         """Parse basic {{c1::text}} syntax."""
         matches = cloze.parse_cloze("The {{c1::capital}} of France is Paris.")
@@ -235,7 +308,7 @@ class ClozeParseTests(TestCase):
         self.assertEqual(matches, [])
 
 
-class ClozeGetNumbersTests(TestCase):
+class ClozeGetNumbersTests(SimpleTestCase):
     """Tests for getting unique cloze numbers."""
 
     def test_get_unique_numbers(self):
@@ -249,8 +322,15 @@ class ClozeGetNumbersTests(TestCase):
         numbers = cloze.get_cloze_numbers("No cloze here")
         self.assertEqual(numbers, set())
 
+    def test_get_numbers_cached(self):
+        """Repeated calls on the same text reuse the cached result."""
+        cloze.clear_caches()
+        text = "{{c1::A}} {{c2::B}}"
+        self.assertIs(cloze.get_cloze_numbers(text), cloze.get_cloze_numbers(text))
+        self.assertEqual(cloze.get_cloze_numbers.cache_info().hits, 1)
+
 
-class ClozeRenderQuestionTests(TestCase):
+class ClozeRenderQuestionTests(SimpleTestCase):
     """Tests for rendering cloze questions."""
 
     def test_render_simple_blank(self):
@@ -282,7 +362,7 @@ class ClozeRenderQuestionTests(TestCase):
         self.assertEqual(result, "[...] and [...]")
 
 
-class ClozeRenderAnswerTests(TestCase):
+class ClozeRenderAnswerTests(SimpleTestCase):
     """Tests for rendering cloze answers."""
 
     def test_render_reveals_answer(self):
@@ -296,8 +376,13 @@ class ClozeRenderAnswerTests(TestCase):
         result = cloze.render_cloze_answer(text, active_number=1)
         self.assertEqual(result, "**One** and Two")
 
+    def test_render_drops_hints(self):
+        """Hints are not part of the revealed answer."""
+        result = cloze.render_cloze_answer("The {{c1::cat::animal}} sat on {{c2::mat}}.")
+        self.assertEqual(result, "The cat sat on mat.")
 
-class ClozeValidationTests(TestCase):
+
+class ClozeValidationTests(SimpleTestCase):
     """Tests for cloze validation."""
 
     def test_valid_cloze(self):
@@ -328,8 +413,27 @@ class ClozeValidationTests(TestCase):
         errors = cloze.validate_cloze_syntax("{{c1::test} missing brace {{c2::ok}}")
         self.assertTrue(any("braces" in e.lower() for e in errors))
 
+    def test_validate_syntax_malformed_beside_valid(self):
+        """A malformed deletion is reported even when a valid one exists."""
+        errors = cloze.validate_cloze_syntax("{{c1::ok}} and {{c2:bad}}")
+        self.assertEqual(len(errors), 1)
+        self.assertIn("malformed", errors[0])
 
-class ClozeExtractAnswersTests(TestCase):
+    def test_validate_syntax_multiple_valid(self):
+        """Several well-formed deletions produce no errors."""
+        errors = cloze.validate_cloze_syntax("{{c1::a}} {{c2::b::hint}} {{c1::c}}")
+        self.assertEqual(errors, [])
+
+    def test_validate_syntax_cached_copy(self):
+        """Cached results are not shared with callers that mutate the list."""
+        cloze.clear_caches()
+        errors = cloze.validate_cloze_syntax("No cloze here")
+        errors.append("extra")
+        self.assertEqual(len(cloze.validate_cloze_syntax("No cloze here")), 1)
+        self.assertEqual(cloze._validate_cloze_syntax.cache_info().hits, 1)
+
+
+class ClozeExtractAnswersTests(SimpleTestCase):
     """Tests for extracting cloze answers."""
 
     def test_extract_single(self):
@@ -350,13 +454,12 @@ class ClozeExtractAnswersTests(TestCase):
 class DeckModelTests(TestCase):
     """Tests for the Deck model."""
 
-    def setUp(self):
-        self.user = User.objects.create_user(
-            username='testuser', password='testpass123'
-        )
-        self.deck = Deck.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_test_user(username='testuser')
+        cls.deck = Deck.objects.create(
             name='Test Deck',
-            owner=self.user
+            owner=cls.user
         )
 
     def test_deck_creation(self):
@@ -370,65 +473,97 @@ class DeckModelTests(TestCase):
 
     def test_cards_due_count_no_cards(self):
         """Empty deck has 0 due cards."""
-        self.assertEqual(self.deck.cards_due_count(), 0)
+        self.assertEqual(self.deck.cards_due_count, 0)
 
     def test_cards_due_count_with_due_cards(self):
         """Count only reviewed cards that are due (not new cards)."""
-        # Due card (next_review in past, has been reviewed)
-        Card.objects.create(
-            deck=self.deck,
-            front='Due card',
-            next_review=timezone.now() - timedelta(days=1),
-            repetitions=1,  # Has been reviewed at least once
-            has_been_reviewed=True
-        )
-        # Not due card (next_review in future)
-        Card.objects.create(
-            deck=self.deck,
-            front='Not due card',
-            next_review=timezone.now() + timedelta(days=1),
-            repetitions=1,
-            has_been_reviewed=True
-        )
-        # New card (never reviewed) - should NOT count as due
-        Card.objects.create(
-            deck=self.deck,
-            front='New card',
-            next_review=timezone.now() - timedelta(days=1),
-            repetitions=0,  # Never reviewed
-            has_been_reviewed=False
-        )
-        self.assertEqual(self.deck.cards_due_count(), 1)
+        Card.objects.bulk_create([
+            # Due card (next_review in past, has been reviewed)
+            Card(
+                deck=self.deck,
+                front='Due card',
+                next_review=timezone.now() - timedelta(days=1),
+                repetitions=1,  # Has been reviewed at least once
+                has_been_reviewed=True
+            ),
+            # Not due card (next_review in future)
+            Card(
+                deck=self.deck,
+                front='Not due card',
+                next_review=timezone.now() + timedelta(days=1),
+                repetitions=1,
+                has_been_reviewed=True
+            ),
+            # New card (never reviewed) - should NOT count as due
+            Card(
+                deck=self.deck,
+                front='New card',
+                next_review=timezone.now() - timedelta(days=1),
+                repetitions=0,  # Never reviewed
+                has_been_reviewed=False
+            ),
+        ])
+        self.assertEqual(self.deck.cards_due_count, 1)
 
     def test_cards_new_count(self):
         """Count only new cards (never reviewed)."""
-        # New card
-        Card.objects.create(
-            deck=self.deck,
-            front='New card',
-            repetitions=0,
-            has_been_reviewed=False
-        )
-        # Reviewed card
-        Card.objects.create(
-            deck=self.deck,
-            front='Reviewed card',
-            repetitions=1,
-            has_been_reviewed=True
-        )
-        self.assertEqual(self.deck.cards_new_count(), 1)
+        Card.objects.bulk_create([
+            # New card
+            Card(
+                deck=self.deck,
+                front='New card',
+                repetitions=0,
+                has_been_reviewed=False
+            ),
+            # Reviewed card
+            Card(
+                deck=self.deck,
+                front='Reviewed card',
+                repetitions=1,
+                has_been_reviewed=True
+            ),
+        ])
+        self.assertEqual(self.deck.cards_new_count, 1)
+
+    def test_counts_cached_on_instance(self):
+        """Counts are computed once per instance until explicitly cleared."""
+        self.assertEqual(self.deck.cards_new_count, 0)
+        Card.objects.create(deck=self.deck, front='New card')
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.deck.cards_new_count, 0)
+
+        del self.deck.cards_new_count
+        self.assertEqual(self.deck.cards_new_count, 1)
+
+    def test_with_counts_annotates_in_one_query(self):
+        """with_counts() fills both count properties without extra queries."""
+        Card.objects.bulk_create([
+            Card(deck=self.deck, front='New card'),
+            Card(
+                deck=self.deck,
+                front='Due card',
+                next_review=timezone.now() - timedelta(days=1),
+                repetitions=1,
+                has_been_reviewed=True
+            ),
+        ])
+        with self.assertNumQueries(1):
+            deck = Deck.objects.with_counts().get(pk=self.deck.pk)
+            self.assertEqual(deck.card_count, 2)
+            self.assertEqual(deck.cards_due_count, 1)
+            self.assertEqual(deck.cards_new_count, 1)
 
 
 class CardModelTests(TestCase):
     """Tests for the Card model."""
 
-    def setUp(self):
-        self.user = User.objects.create_user(
-            username='testuser', password='testpass123'
-        )
-        self.deck = Deck.objects.create(name='Test Deck', owner=self.user)
-        self.card = Card.objects.create(
-            deck=self.deck,
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_test_user(username='testuser')
+        cls.deck = Deck.objects.create(name='Test Deck', owner=cls.user)
+        cls.card = Card.objects.create(
+            deck=cls.deck,
             front='What is 2+2?',
             back='4'
         )
@@ -451,30 +586,45 @@ class CardModelTests(TestCase):
 
     def test_is_due_when_past(self):
         """Card is due when next_review is in the past and has been reviewed."""
-        self.card.repetitions = 1  # Card has been reviewed
+        self.card.has_been_reviewed = True
         self.card.next_review = timezone.now() - timedelta(hours=1)
-        self.card.save()
+        self.card.save(update_fields=['has_been_reviewed', 'next_review'])
         self.assertTrue(self.card.is_due())
 
     def test_is_due_when_now(self):
         """Card is due when next_review is now and has been reviewed."""
-        self.card.repetitions = 1  # Card has been reviewed
+        self.card.has_been_reviewed = True
         self.card.next_review = timezone.now()
-        self.card.save()
+        self.card.save(update_fields=['has_been_reviewed', 'next_review'])
         self.assertTrue(self.card.is_due())
 
     def test_is_not_due_when_future(self):
         """Card is not due when next_review is in the future."""
-        self.card.repetitions = 1  # Card has been reviewed
+        self.card.has_been_reviewed = True
         self.card.next_review = timezone.now() + timedelta(hours=1)
-        self.card.save()
+        self.card.save(update_fields=['has_been_reviewed', 'next_review'])
         self.assertFalse(self.card.is_due())
 
+    def test_is_due_at_given_time(self):
+        """is_due compares against the supplied timestamp when given."""
+        self.card.has_been_reviewed = True
+        self.card.next_review = timezone.now() + timedelta(hours=1)
+        self.assertFalse(self.card.is_due())
+        self.assertTrue(self.card.is_due(now=self.card.next_review))
+
+    def test_lapsed_card_is_due(self):
+        """A failed card has repetitions reset to 0 but is still due."""
+        self.card.has_been_reviewed = True
+        self.card.repetitions = 0  # Reset by a failed review
+        self.card.next_review = timezone.now() - timedelta(hours=1)
+        self.card.save(update_fields=['has_been_reviewed', 'repetitions', 'next_review'])
+        self.assertTrue(self.card.is_due())
+
     def test_new_card_is_not_due(self):
         """New card (never reviewed) is not considered due."""
         self.card.repetitions = 0  # New card
         self.card.next_review = timezone.now() - timedelta(hours=1)
-        self.card.save()
+        self.card.save(update_fields=['repetitions', 'next_review'])
         self.assertFalse(self.card.is_due())
 
     def test_review_updates_card_state(self):
@@ -515,13 +665,12 @@ class CardModelTests(TestCase):
 class ReviewLogModelTests(TestCase):
     """Tests for the ReviewLog model."""
 
-    def setUp(self):
-        self.user = User.objects.create_user(
-            username='testuser', password='testpass123'
-        )
-        self.deck = Deck.objects.create(name='Test Deck', owner=self.user)
-        self.card = Card.objects.create(
-            deck=self.deck,
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_test_user(username='testuser')
+        cls.deck = Deck.objects.create(name='Test Deck', owner=cls.user)
+        cls.card = Card.objects.create(
+            deck=cls.deck,
             front='Test',
             back='Test'
         )
@@ -541,6 +690,11 @@ class ReviewLogModelTests(TestCase):
         self.assertEqual(log.interval_before, 0)
         self.assertEqual(log.interval_after, 1)
 
+    def test_review_log_timestamp_matches_card(self):
+        """The log's reviewed_at is the same instant as card.last_reviewed."""
+        log = self.card.review(quality=4)
+        self.assertEqual(log.reviewed_at, self.card.last_reviewed)
+
     def test_multiple_reviews_create_multiple_logs(self):
         """Each review creates a separate log entry."""
         self.card.review(quality=4)
@@ -550,6 +704,81 @@ class ReviewLogModelTests(TestCase):
         logs = ReviewLog.objects.filter(card=self.card)
         self.assertEqual(logs.count(), 3)
 
+    def test_with_card_avoids_per_log_queries(self):
+        """with_card() loads the card and deck alongside each log."""
+        self.card.review(quality=4)
+        self.card.review(quality=5)
+        with self.assertNumQueries(1):
+            names = [log.card.deck.name for log in ReviewLog.objects.with_card()]
+        self.assertEqual(names, ['Test Deck', 'Test Deck'])
+
+    def test_review_batch_updates_cards_and_logs(self):
+        """review_batch schedules every card and logs each review."""
+        other = Card.objects.create(deck=self.deck, front='Other', back='Other')
+
+        with self.assertNumQueries(5):  # select, savepoint, update, insert, release
+            logs = Card.review_batch({self.card.pk: 5, other.pk: 1})
+
+        self.assertEqual(len(logs), 2)
+        self.assertEqual(ReviewLog.objects.filter(card__deck=self.deck).count(), 2)
+        self.card.refresh_from_db()
+        other.refresh_from_db()
+        self.assertEqual(self.card.repetitions, 1)
+        self.assertTrue(self.card.has_been_reviewed)
+        self.assertEqual(other.repetitions, 0)
+        self.assertEqual(self.card.last_reviewed, other.last_reviewed)
+
+
+class UserPreferencesStreakTests(TestCase):
+    """Tests for streak tracking on UserPreferences."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_test_user(username='testuser')
+        cls.prefs = cls.user.preferences
+        cls.today = datetime(2025, 6, 10).date()
+
+    def test_update_streak_uses_given_date(self):
+        """An explicit today should drive the streak instead of the clock."""
+        self.prefs.last_study_date = self.today - timedelta(days=1)
+        self.prefs.current_streak = 4
+        self.prefs.update_streak(today=self.today)
+
+        self.assertEqual(self.prefs.current_streak, 5)
+        self.assertEqual(self.prefs.last_study_date, self.today)
+
+    def test_check_streak_at_risk_uses_given_date(self):
+        """Streak is at risk only when the user hasn't studied on the given date."""
+        self.prefs.current_streak = 3
+        self.prefs.last_study_date = self.today
+        self.assertFalse(self.prefs.check_streak_at_risk(today=self.today))
+        self.assertTrue(self.prefs.check_streak_at_risk(today=self.today + timedelta(days=1)))
+
+    def test_get_local_date_converts_given_time(self):
+        """get_local_date should convert a supplied UTC time to the user's date."""
+        self.prefs.user_timezone = 'Asia/Tokyo'
+        now = datetime(2025, 6, 10, 20, 0, tzinfo=dt_timezone.utc)  # 05:00 next day in Tokyo
+        self.assertEqual(self.prefs.get_local_date(now), self.today + timedelta(days=1))
+
+
+class UserPreferencesSignalTests(TestCase):
+    """Tests for the post_save handler that creates UserPreferences."""
+
+    def test_new_user_gets_preferences(self):
+        """Creating a user should create their preferences row."""
+        user = create_test_user(username='newuser')
+        self.assertTrue(UserPreferences.objects.filter(user=user).exists())
+
+    def test_fixture_load_skips_preferences(self):
+        """Raw saves (loaddata) leave preferences to the fixture itself."""
+        fixture = json.dumps([{
+            'model': 'auth.user', 'pk': 500,
+            'fields': {'username': 'fixtureuser', 'password': _TEST_PASSWORD_HASH},
+        }])
+        for obj in serializers.deserialize('json', fixture):
+            obj.save()
+        self.assertFalse(UserPreferences.objects.filter(user_id=500).exists())
+
 
 # =============================================================================
 # Form Tests
@@ -589,6 +818,13 @@ class StyledFormMixinTests(TestCase):
         self.assertIn('w-4', checkbox_class)
         self.assertNotIn('block w-full', checkbox_class)
 
+    def test_time_input_gets_picker_style(self):
+        """Time inputs get the base classes plus a dark color-scheme."""
+        form = ReviewReminderForm()
+        time_class = form.fields['preferred_time'].widget.attrs['class']
+        self.assertIn('block w-full', time_class)
+        self.assertIn('dark:[color-scheme:dark]', time_class)
+
 
 class RegisterFormTests(TestCase):
     """Tests for user registration form."""
@@ -834,45 +1070,56 @@ class ReviewReminderFormTests(TestCase):
 # View Tests
 # =============================================================================
 
-from django.test import Client
 from django.urls import reverse
-import json
+
+# Argument-free URLs, reversed once at import rather than in every test
+DASHBOARD_URL = reverse('dashboard')
+DECK_IMPORT_URL = reverse('deck_import')
+DECK_LIST_URL = reverse('deck_list')
+VERIFICATION_SENT_URL = reverse('verification_sent')
+REVIEW_STRUGGLING_URL = reverse('review_struggling')
+REVIEW_SESSION_URL = reverse('review_session')
+RESEND_VERIFICATION_URL = reverse('resend_verification')
+PRACTICE_SESSION_URL = reverse('practice_session')
+LOGIN_URL = reverse('login')
+SETTINGS_URL = reverse('settings')
+REGISTER_URL = reverse('register')
+LOGOUT_URL = reverse('logout')
+DECK_CREATE_URL = reverse('deck_create')
+API_SET_THEME_URL = reverse('api_set_theme')
+API_GET_THEME_URL = reverse('api_get_theme')
 
 
 class AuthViewTests(TestCase):
     """Tests for authentication views."""
 
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123'
-        )
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_test_user(username='testuser', email='test@example.com')
 
     def test_login_page_loads(self):
         """Login page should load for anonymous users."""
-        response = self.client.get(reverse('login'))
+        response = self.client.get(LOGIN_URL)
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'Sign in')
 
     def test_login_redirects_authenticated_user(self):
         """Authenticated users should be redirected from login page."""
-        self.client.login(username='testuser', password='testpass123')
-        response = self.client.get(reverse('login'))
-        self.assertRedirects(response, reverse('dashboard'))
+        self.client.login(username='testuser', password=TEST_PASSWORD)
+        response = self.client.get(LOGIN_URL)
+        self.assertRedirects(response, DASHBOARD_URL, fetch_redirect_response=False)
 
     def test_login_success(self):
         """Valid credentials should log user in."""
-        response = self.client.post(reverse('login'), {
+        response = self.client.post(LOGIN_URL, {
             'username': 'testuser',
-            'password': 'testpass123',
+            'password': TEST_PASSWORD,
         })
-        self.assertRedirects(response, reverse('dashboard'))
+        self.assertRedirects(response, DASHBOARD_URL, fetch_redirect_response=False)
 
     def test_login_failure(self):
         """Invalid credentials should show error."""
-        response = self.client.post(reverse('login'), {
+        response = self.client.post(LOGIN_URL, {
             'username': 'testuser',
             'password': 'wrongpassword',
         })
@@ -881,60 +1128,60 @@ class AuthViewTests(TestCase):
 
     def test_register_page_loads(self):
         """Register page should load for anonymous users."""
-        response = self.client.get(reverse('register'))
+        response = self.client.get(REGISTER_URL)
         self.assertEqual(response.status_code, 200)
 
     def test_register_redirects_authenticated_user(self):
         """Authenticated users should be redirected from register page."""
-        self.client.login(username='testuser', password='testpass123')
-        response = self.client.get(reverse('register'))
-        self.assertRedirects(response, reverse('dashboard'))
+        self.client.login(username='testuser', password=TEST_PASSWORD)
+        response = self.client.get(REGISTER_URL)
+        self.assertRedirects(response, DASHBOARD_URL, fetch_redirect_response=False)
 
     def test_register_success(self):
         """Valid registration should create inactive user and redirect to verification page."""
-        response = self.client.post(reverse('register'), {
+        response = self.client.post(REGISTER_URL, {
             'username': 'newuser',
             'email': 'new@example.com',
             'password1': 'SecurePass123!',
             'password2': 'SecurePass123!',
         })
-        self.assertRedirects(response, reverse('verification_sent'))
+        self.assertRedirects(response, VERIFICATION_SENT_URL, fetch_redirect_response=False)
         user = User.objects.get(username='newuser')
         self.assertFalse(user.is_active)
         self.assertTrue(hasattr(user, 'email_verification'))
+        self.assertTrue(hasattr(user, 'preferences'))
 
     def test_logout(self):
         """Logout should redirect to login page."""
-        self.client.login(username='testuser', password='testpass123')
-        response = self.client.post(reverse('logout'))
-        self.assertRedirects(response, reverse('login'))
+        self.client.login(username='testuser', password=TEST_PASSWORD)
+        response = self.client.post(LOGOUT_URL)
+        self.assertRedirects(response, LOGIN_URL, fetch_redirect_response=False)
 
 
-class DashboardViewTests(TestCase):
+class DashboardViewTests(LoggedInDeckMixin, TestCase):
     """Tests for dashboard view."""
 
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username='testuser', password='testpass123'
-        )
-        self.deck = Deck.objects.create(name='Test Deck', owner=self.user)
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.past = timezone.now() - timedelta(hours=1)
 
     def test_dashboard_requires_login(self):
         """Dashboard should redirect anonymous users to login."""
-        response = self.client.get(reverse('dashboard'))
-        self.assertRedirects(response, f"{reverse('login')}?next={reverse('dashboard')}")
+        self.client.logout()
+        response = self.client.get(DASHBOARD_URL)
+        self.assertRedirects(
+            response, f"{LOGIN_URL}?next={DASHBOARD_URL}", fetch_redirect_response=False
+        )
 
     def test_dashboard_loads_for_authenticated_user(self):
         """Dashboard should load for authenticated users."""
-        self.client.login(username='testuser', password='testpass123')
-        response = self.client.get(reverse('dashboard'))
+        response = self.client.get(DASHBOARD_URL)
         self.assertEqual(response.status_code, 200)
 
     def test_dashboard_shows_deck_stats(self):
         """Dashboard should show deck information."""
-        self.client.login(username='testuser', password='testpass123')
-        response = self.client.get(reverse('dashboard'))
+        response = self.client.get(DASHBOARD_URL)
         self.assertContains(response, 'Test Deck')
 
     def test_dashboard_shows_due_cards(self):
@@ -942,90 +1189,136 @@ class DashboardViewTests(TestCase):
         Card.objects.create(
             deck=self.deck,
             front='Test card',
-            next_review=timezone.now() - timedelta(hours=1)
+            next_review=self.past,
+            has_been_reviewed=True
         )
-        self.client.login(username='testuser', password='testpass123')
-        response = self.client.get(reverse('dashboard'))
-        self.assertContains(response, '1')  # 1 card due
+        response = self.client.get(DASHBOARD_URL)
+        self.assertEqual(response.context['total_due'], 1)
+        self.assertEqual(response.context['decks'][0].due_count, 1)
+
+    def test_dashboard_query_count(self):
+        """Pin the dashboard's query count so regressions show up."""
+        Deck.objects.create(name='Second Deck', owner=self.user)
+        # session, user, the view's preferences, one aggregate each for the
+        # card and review statistics, one grouped per-deck review query, the
+        # decks, and the context processor's preferences
+        with self.assertNumQueries(8):
+            response = self.client.get(DASHBOARD_URL)
+        self.assertEqual(len(response.context['decks']), 2)
 
 
-class DeckViewTests(TestCase):
+class DeckViewTests(LoggedInUserMixin, TestCase):
     """Tests for deck CRUD views."""
 
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username='testuser', password='testpass123'
-        )
-        self.other_user = User.objects.create_user(
-            username='otheruser', password='testpass123'
-        )
-        self.deck = Deck.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.other_user = create_test_user(username='otheruser')
+        cls.deck = Deck.objects.create(
             name='My Deck',
             description='Test description',
-            owner=self.user
+            owner=cls.user
         )
-        self.client.login(username='testuser', password='testpass123')
+        # Reverse the URLs once per class
+        cls.deck_update_url = reverse('deck_update', kwargs={'pk': cls.deck.pk})
+        cls.deck_delete_url = reverse('deck_delete', kwargs={'pk': cls.deck.pk})
+        cls.deck_detail_url = reverse('deck_detail', kwargs={'pk': cls.deck.pk})
+        cls.deck_export_url = reverse('deck_export', kwargs={'pk': cls.deck.pk})
 
     def test_deck_list_view(self):
         """Deck list should show user's decks."""
-        response = self.client.get(reverse('deck_list'))
+        response = self.client.get(DECK_LIST_URL)
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'My Deck')
 
     def test_deck_list_excludes_other_users_decks(self):
         """Deck list should not show other users' decks."""
         Deck.objects.create(name='Other Deck', owner=self.other_user)
-        response = self.client.get(reverse('deck_list'))
+        response = self.client.get(DECK_LIST_URL)
         self.assertNotContains(response, 'Other Deck')
 
     def test_deck_create_view_get(self):
         """Deck create form should load."""
-        response = self.client.get(reverse('deck_create'))
+        response = self.client.get(DECK_CREATE_URL)
         self.assertEqual(response.status_code, 200)
 
     def test_deck_create_view_post(self):
         """Valid POST should create deck."""
-        response = self.client.post(reverse('deck_create'), {
+        response = self.client.post(DECK_CREATE_URL, {
             'name': 'New Deck',
             'description': 'New description',
         })
-        self.assertRedirects(response, reverse('deck_list'))
+        self.assertRedirects(response, DECK_LIST_URL, fetch_redirect_response=False)
         self.assertTrue(Deck.objects.filter(name='New Deck', owner=self.user).exists())
 
     def test_deck_update_view_get(self):
         """Deck update form should load."""
-        response = self.client.get(reverse('deck_update', kwargs={'pk': self.deck.pk}))
+        response = self.client.get(self.deck_update_url)
         self.assertEqual(response.status_code, 200)
 
     def test_deck_update_view_post(self):
         """Valid POST should update deck."""
-        response = self.client.post(reverse('deck_update', kwargs={'pk': self.deck.pk}), {
+        response = self.client.post(self.deck_update_url, {
             'name': 'Updated Name',
             'description': 'Updated description',
         })
-        self.assertRedirects(response, reverse('deck_list'))
+        self.assertRedirects(response, DECK_LIST_URL, fetch_redirect_response=False)
         self.deck.refresh_from_db()
         self.assertEqual(self.deck.name, 'Updated Name')
 
     def test_deck_delete_view_get(self):
         """Deck delete confirmation should load."""
-        response = self.client.get(reverse('deck_delete', kwargs={'pk': self.deck.pk}))
+        response = self.client.get(self.deck_delete_url)
         self.assertEqual(response.status_code, 200)
 
     def test_deck_delete_view_post(self):
         """POST should delete deck."""
-        response = self.client.post(reverse('deck_delete', kwargs={'pk': self.deck.pk}))
-        self.assertRedirects(response, reverse('deck_list'))
+        response = self.client.post(self.deck_delete_url)
+        self.assertRedirects(response, DECK_LIST_URL, fetch_redirect_response=False)
         self.assertFalse(Deck.objects.filter(pk=self.deck.pk).exists())
 
     def test_deck_detail_view(self):
         """Deck detail should show deck info and cards."""
         Card.objects.create(deck=self.deck, front='Test Q', back='Test A')
-        response = self.client.get(reverse('deck_detail', kwargs={'pk': self.deck.pk}))
+        response = self.client.get(self.deck_detail_url)
         self.assertEqual(response.status_code, 200)
-        self.assertContains(response, 'My Deck')
-        self.assertContains(response, 'Test Q')
+        body = response.content.decode()
+        self.assertIn('My Deck', body)
+        self.assertIn('Test Q', body)
+
+    def test_deck_detail_due_badge(self):
+        """Only reviewed cards past their next_review get the Due badge."""
+        past = timezone.now() - timedelta(days=1)
+        Card.objects.bulk_create([
+            Card(deck=self.deck, front='Due Q', next_review=past,
+                 repetitions=1, has_been_reviewed=True),
+            Card(deck=self.deck, front='Later Q', has_been_reviewed=True,
+                 next_review=timezone.now() + timedelta(days=1)),
+        ])
+        response = self.client.get(self.deck_detail_url)
+        due = {card.front: card.due for card in response.context['cards']}
+        self.assertEqual(due, {'Due Q': True, 'Later Q': False})
+        self.assertContains(response, 'Review (1)')
+
+    def test_deck_list_query_count(self):
+        """Deck list cost doesn't grow with the number of decks."""
+        second = Deck.objects.create(name='Second Deck', owner=self.user)
+        Card.objects.create(deck=second, front='Q', back='A')
+        # session, user, preferences (context processor), annotated decks
+        with self.assertNumQueries(4):
+            response = self.client.get(DECK_LIST_URL)
+        self.assertContains(response, 'Second Deck')
+
+    def test_deck_detail_query_count(self):
+        """Deck detail cost doesn't grow with the number of cards."""
+        Card.objects.bulk_create([
+            Card(deck=self.deck, front=f'Q{i}', back=f'A{i}') for i in range(3)
+        ])
+        self.client.get(self.deck_detail_url)
+
+        # session, user, deck with counts, preferences, cards
+        with self.assertNumQueries(5):
+            self.client.get(self.deck_detail_url)
 
     def test_cannot_access_other_users_deck(self):
         """Users cannot access other users' deck details."""
@@ -1036,114 +1329,138 @@ class DeckViewTests(TestCase):
     def test_deck_export(self):
         """Deck export should return JSON file."""
         Card.objects.create(deck=self.deck, front='Q1', back='A1')
-        response = self.client.get(reverse('deck_export', kwargs={'pk': self.deck.pk}))
+        response = self.client.get(self.deck_export_url)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response['Content-Type'], 'application/json')
-        data = json.loads(response.content)
+        data = response.json()
         self.assertEqual(data['name'], 'My Deck')
         self.assertEqual(len(data['cards']), 1)
 
+    def test_deck_export_query_count(self):
+        """Deck export loads all cards in one query, however many there are."""
+        Card.objects.bulk_create([
+            Card(deck=self.deck, front=f'Q{i}', back=f'A{i}') for i in range(5)
+        ])
+        # session, user, deck, cards
+        with self.assertNumQueries(4):
+            response = self.client.get(self.deck_export_url)
+        self.assertEqual(len(response.json()['cards']), 5)
+
     def test_deck_import_get(self):
         """Deck import page should load."""
-        response = self.client.get(reverse('deck_import'))
+        response = self.client.get(DECK_IMPORT_URL)
         self.assertEqual(response.status_code, 200)
 
 
-class CardViewTests(TestCase):
+class CardViewTests(LoggedInDeckMixin, TestCase):
     """Tests for card CRUD views."""
 
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username='testuser', password='testpass123'
-        )
-        self.deck = Deck.objects.create(name='Test Deck', owner=self.user)
-        self.card = Card.objects.create(
-            deck=self.deck,
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.card = Card.objects.create(
+            deck=cls.deck,
             front='Test Question',
             back='Test Answer'
         )
-        self.client.login(username='testuser', password='testpass123')
+        # Reverse the URLs once per class
+        cls.card_create_url = reverse('card_create', kwargs={'deck_pk': cls.deck.pk})
+        cls.deck_detail_url = reverse('deck_detail', kwargs={'pk': cls.deck.pk})
+        cls.card_update_url = reverse('card_update', kwargs={'pk': cls.card.pk})
+        cls.card_delete_url = reverse('card_delete', kwargs={'pk': cls.card.pk})
 
     def test_card_create_view_get(self):
         """Card create form should load."""
-        response = self.client.get(reverse('card_create', kwargs={'deck_pk': self.deck.pk}))
+        response = self.client.get(self.card_create_url)
         self.assertEqual(response.status_code, 200)
 
     def test_card_create_view_post(self):
         """Valid POST should create card."""
-        response = self.client.post(reverse('card_create', kwargs={'deck_pk': self.deck.pk}), {
+        response = self.client.post(self.card_create_url, {
             'card_type': 'basic',
             'front': 'New Question',
             'back': 'New Answer',
             'notes': '',
         })
-        self.assertRedirects(response, reverse('deck_detail', kwargs={'pk': self.deck.pk}))
+        self.assertRedirects(response, self.deck_detail_url, fetch_redirect_response=False)
         self.assertTrue(Card.objects.filter(front='New Question').exists())
 
     def test_card_update_view_get(self):
         """Card update form should load."""
-        response = self.client.get(reverse('card_update', kwargs={'pk': self.card.pk}))
+        response = self.client.get(self.card_update_url)
         self.assertEqual(response.status_code, 200)
 
     def test_card_update_view_post(self):
         """Valid POST should update card."""
-        response = self.client.post(reverse('card_update', kwargs={'pk': self.card.pk}), {
+        response = self.client.post(self.card_update_url, {
             'card_type': 'basic',
             'front': 'Updated Question',
             'back': 'Updated Answer',
             'notes': '',
         })
-        self.assertRedirects(response, reverse('deck_detail', kwargs={'pk': self.deck.pk}))
+        self.assertRedirects(response, self.deck_detail_url, fetch_redirect_response=False)
         self.card.refresh_from_db()
         self.assertEqual(self.card.front, 'Updated Question')
 
     def test_card_delete_view_get(self):
         """Card delete confirmation should load."""
-        response = self.client.get(reverse('card_delete', kwargs={'pk': self.card.pk}))
+        response = self.client.get(self.card_delete_url)
         self.assertEqual(response.status_code, 200)
 
     def test_card_delete_view_post(self):
         """POST should delete card."""
-        response = self.client.post(reverse('card_delete', kwargs={'pk': self.card.pk}))
-        self.assertRedirects(response, reverse('deck_detail', kwargs={'pk': self.deck.pk}))
+        response = self.client.post(self.card_delete_url)
+        self.assertRedirects(response, self.deck_detail_url, fetch_redirect_response=False)
         self.assertFalse(Card.objects.filter(pk=self.card.pk).exists())
 
 
-class ReviewViewTests(TestCase):
+class ReviewViewTests(LoggedInDeckMixin, TestCase):
     """Tests for review session views."""
 
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username='testuser', password='testpass123'
-        )
-        from .models import UserPreferences
-        UserPreferences.objects.create(user=self.user)
-        self.deck = Deck.objects.create(name='Test Deck', owner=self.user)
-        self.card = Card.objects.create(
-            deck=self.deck,
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        now = timezone.now()
+        cls.past = now - timedelta(hours=1)
+        cls.future = now + timedelta(days=1)
+        cls.card = Card.objects.create(
+            deck=cls.deck,
             front='Test Question',
             back='Test Answer',
-            next_review=timezone.now() - timedelta(hours=1)  # Due now
+            next_review=cls.past  # Due now
         )
-        self.client.login(username='testuser', password='testpass123')
 
     def test_review_session_loads(self):
         """Review session should load with due cards."""
-        response = self.client.get(reverse('review_session'))
+        response = self.client.get(REVIEW_SESSION_URL)
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'Test Question')
 
+    def test_review_session_query_count(self):
+        """Review session cost doesn't grow with the number of cards."""
+        second = Deck.objects.create(name='Second Deck', owner=self.user)
+        Card.objects.bulk_create([
+            Card(deck=deck, front=f'Q{i}', back=f'A{i}', next_review=self.past,
+                 has_been_reviewed=i % 2 == 0)
+            for deck in (self.deck, second) for i in range(5)
+        ])
+        self.client.get(REVIEW_SESSION_URL)
+
+        # session, user, preferences (view), due cards, new cards,
+        # preferences (context processor)
+        with self.assertNumQueries(6):
+            response = self.client.get(REVIEW_SESSION_URL)
+        self.assertEqual(len(response.context['cards']), 11)
+
     def test_review_session_redirects_when_no_cards_due(self):
         """Review session should redirect when no cards are due or new."""
         # Card is not due (next_review in future) and not new (has_been_reviewed=True)
-        self.card.next_review = timezone.now() + timedelta(days=1)
+        self.card.next_review = self.future
         self.card.repetitions = 1  # Not a new card
         self.card.has_been_reviewed = True
-        self.card.save()
-        response = self.client.get(reverse('review_session'))
-        self.assertRedirects(response, reverse('dashboard'))
+        self.card.save(update_fields=['next_review', 'repetitions', 'has_been_reviewed'])
+        response = self.client.get(REVIEW_SESSION_URL)
+        self.assertRedirects(response, DASHBOARD_URL, fetch_redirect_response=False)
 
     def test_review_deck_specific(self):
         """Review can be limited to specific deck."""
@@ -1154,46 +1471,26 @@ class ReviewViewTests(TestCase):
         """Review card API should update card and return JSON."""
         response = self.client.post(
             reverse('review_card', kwargs={'pk': self.card.pk}),
-            data=json.dumps({'quality': 4}),
+            data={'quality': 4},
             content_type='application/json'
         )
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.content)
+        data = response.json()
         self.assertTrue(data['success'])
         self.assertIn('next_review', data)
 
-    def test_review_card_api_invalid_quality(self):
-        """Review card API should reject invalid quality."""
-        response = self.client.post(
-            reverse('review_card', kwargs={'pk': self.card.pk}),
-            data=json.dumps({'quality': 10}),
-            content_type='application/json'
-        )
-        self.assertEqual(response.status_code, 400)
-
-    def test_review_card_api_invalid_json(self):
-        """Review card API should reject invalid JSON."""
-        response = self.client.post(
-            reverse('review_card', kwargs={'pk': self.card.pk}),
-            data='not json',
-            content_type='application/json'
-        )
-        self.assertEqual(response.status_code, 400)
+    def test_review_card_api_rejects_bad_input(self):
+        """Review card API should reject invalid quality and invalid JSON."""
+        url = reverse('review_card', kwargs={'pk': self.card.pk})
+        for payload in ({'quality': 10}, 'not json'):
+            with self.subTest(payload=payload):
+                response = self.client.post(url, data=payload, content_type='application/json')
+                self.assertEqual(response.status_code, 400)
 
 
-class StrugglingCardsReviewTests(TestCase):
+class StrugglingCardsReviewTests(LoggedInDeckMixin, TestCase):
     """Tests for struggling cards review feature."""
 
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username='testuser', password='testpass123'
-        )
-        from .models import UserPreferences
-        UserPreferences.objects.create(user=self.user)
-        self.deck = Deck.objects.create(name='Test Deck', owner=self.user)
-        self.client.login(username='testuser', password='testpass123')
-
     def test_struggling_review_redirects_when_no_struggling_cards(self):
         """Should redirect to dashboard when no struggling cards exist."""
         # Create a card with normal ease factor
@@ -1205,8 +1502,8 @@ class StrugglingCardsReviewTests(TestCase):
             repetitions=1
         )
 
-        response = self.client.get(reverse('review_struggling'))
-        self.assertRedirects(response, reverse('dashboard'))
+        response = self.client.get(REVIEW_STRUGGLING_URL)
+        self.assertRedirects(response, DASHBOARD_URL, fetch_redirect_response=False)
 
     def test_struggling_review_loads_with_struggling_cards(self):
         """Should load review session with struggling cards."""
@@ -1220,9 +1517,9 @@ class StrugglingCardsReviewTests(TestCase):
             has_been_reviewed=True
         )
 
-        response = self.client.get(reverse('review_struggling'))
+        response = self.client.get(REVIEW_STRUGGLING_URL)
         self.assertEqual(response.status_code, 200)
-        self.assertContains(response, 'Struggling Card')
+        self.assertEqual([c.front for c in response.context['cards']], ['Struggling Card'])
         self.assertEqual(response.context['session_type'], 'struggling')
 
     def test_struggling_review_excludes_new_cards(self):
@@ -1237,95 +1534,84 @@ class StrugglingCardsReviewTests(TestCase):
             has_been_reviewed=False
         )
 
-        response = self.client.get(reverse('review_struggling'))
-        self.assertRedirects(response, reverse('dashboard'))
+        response = self.client.get(REVIEW_STRUGGLING_URL)
+        self.assertRedirects(response, DASHBOARD_URL, fetch_redirect_response=False)
 
     def test_struggling_review_only_includes_low_ease_cards(self):
         """Should only include cards with ease factor < 2.0."""
-        # Create cards with different ease factors
-        struggling = Card.objects.create(
-            deck=self.deck,
-            front='Struggling',
-            back='Answer',
-            ease_factor=1.8,
-            repetitions=1,
-            has_been_reviewed=True
-        )
-        normal = Card.objects.create(
-            deck=self.deck,
-            front='Normal',
-            back='Answer',
-            ease_factor=2.5,
-            repetitions=1,
-            has_been_reviewed=True
-        )
-
-        response = self.client.get(reverse('review_struggling'))
+        Card.objects.bulk_create([
+            # Create cards with different ease factors
+            Card(
+                deck=self.deck,
+                front='Struggling',
+                back='Answer',
+                ease_factor=1.8,
+                repetitions=1,
+                has_been_reviewed=True
+            ),
+            Card(
+                deck=self.deck,
+                front='Normal',
+                back='Answer',
+                ease_factor=2.5,
+                repetitions=1,
+                has_been_reviewed=True
+            ),
+        ])
+
+        response = self.client.get(REVIEW_STRUGGLING_URL)
         self.assertEqual(response.status_code, 200)
-        self.assertContains(response, 'Struggling')
-        self.assertNotContains(response, 'Normal')
+        self.assertEqual([c.front for c in response.context['cards']], ['Struggling'])
 
     def test_struggling_review_requires_login(self):
         """Should require login to access."""
         self.client.logout()
-        response = self.client.get(reverse('review_struggling'))
+        response = self.client.get(REVIEW_STRUGGLING_URL)
         self.assertEqual(response.status_code, 302)
         self.assertIn('/login/', response.url)
 
-    def test_dashboard_struggling_button_enabled(self):
-        """Dashboard should show enabled Struggling button when struggling cards exist."""
-        Card.objects.create(
-            deck=self.deck,
-            front='Struggling',
-            back='Answer',
-            ease_factor=1.5,
-            repetitions=1,
-            has_been_reviewed=True
-        )
-
-        response = self.client.get(reverse('dashboard'))
-        self.assertEqual(response.status_code, 200)
-        self.assertContains(response, 'href="/review/struggling/"')
-        self.assertContains(response, 'Needs Work (1)')
-
-    def test_dashboard_struggling_button_disabled(self):
-        """Dashboard should show disabled Struggling button when no struggling cards."""
-        Card.objects.create(
+    def test_dashboard_struggling_button(self):
+        """The Struggling button is enabled only when struggling cards exist."""
+        card = Card.objects.create(
             deck=self.deck,
-            front='Normal',
+            front='Card',
             back='Answer',
             ease_factor=2.5,
             repetitions=1,
             has_been_reviewed=True
         )
 
-        response = self.client.get(reverse('dashboard'))
-        self.assertEqual(response.status_code, 200)
-        self.assertNotContains(response, 'href="/review/struggling/"')
-        self.assertContains(response, 'cursor-not-allowed')  # Disabled button style
+        with self.subTest('disabled'):
+            response = self.client.get(DASHBOARD_URL)
+            self.assertEqual(response.context['struggling_cards'], 0)
+            self.assertNotContains(response, 'href="/review/struggling/"')
+            self.assertContains(response, 'cursor-not-allowed')  # Disabled button style
 
+        card.ease_factor = 1.5
+        card.save(update_fields=['ease_factor'])
+        with self.subTest('enabled'):
+            response = self.client.get(DASHBOARD_URL)
+            self.assertEqual(response.context['struggling_cards'], 1)
+            self.assertContains(response, 'href="/review/struggling/"')
+            self.assertContains(response, 'Needs Work (1)')
 
-class SettingsViewTests(TestCase):
+
+class SettingsViewTests(LoggedInUserMixin, TestCase):
     """Tests for settings views."""
 
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username='testuser', password='testpass123'
-        )
-        from .models import UserPreferences, ReviewReminder
-        UserPreferences.objects.create(user=self.user)
-        ReviewReminder.objects.create(user=self.user)
-        self.client.login(username='testuser', password='testpass123')
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        ReviewReminder.objects.create(user=cls.user)
 
     def test_settings_page_loads(self):
         """Settings page should load."""
-        response = self.client.get(reverse('settings'))
+        response = self.client.get(SETTINGS_URL)
         self.assertEqual(response.status_code, 200)
 
     def test_settings_update(self):
         """Settings can be updated via POST."""
-        response = self.client.post(reverse('settings'), {
+        response = self.client.post(SETTINGS_URL, {
             'theme': 'dark',
             'card_text_size': 'xlarge',
             'new_cards_per_day': 30,
@@ -1336,56 +1622,40 @@ class SettingsViewTests(TestCase):
             'preferred_time': '10:00',
             'custom_days': '0,1,2,3,4',
         })
-        self.assertRedirects(response, reverse('settings'))
+        self.assertRedirects(response, SETTINGS_URL, fetch_redirect_response=False)
 
 
-class ThemeAPITests(TestCase):
+class ThemeAPITests(LoggedInUserMixin, TestCase):
     """Tests for theme API endpoints."""
 
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username='testuser', password='testpass123'
-        )
-        from .models import UserPreferences
-        UserPreferences.objects.create(user=self.user)
-        self.client.login(username='testuser', password='testpass123')
-
     def test_set_theme_api(self):
         """Theme can be set via API."""
         response = self.client.post(
-            reverse('api_set_theme'),
-            data=json.dumps({'theme': 'dark'}),
+            API_SET_THEME_URL,
+            data={'theme': 'dark'},
             content_type='application/json'
         )
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.content)
+        data = response.json()
         self.assertTrue(data['success'])
         self.assertEqual(data['theme'], 'dark')
 
-    def test_set_theme_api_invalid_theme(self):
-        """Invalid theme should be rejected."""
-        response = self.client.post(
-            reverse('api_set_theme'),
-            data=json.dumps({'theme': 'invalid'}),
-            content_type='application/json'
-        )
-        self.assertEqual(response.status_code, 400)
-
-    def test_set_theme_api_invalid_json(self):
-        """Invalid JSON should be rejected."""
-        response = self.client.post(
-            reverse('api_set_theme'),
-            data='not json',
-            content_type='application/json'
-        )
-        self.assertEqual(response.status_code, 400)
+    def test_set_theme_api_rejects_bad_input(self):
+        """An invalid theme or invalid JSON should be rejected."""
+        for payload in ({'theme': 'invalid'}, 'not json'):
+            with self.subTest(payload=payload):
+                response = self.client.post(
+                    API_SET_THEME_URL,
+                    data=payload,
+                    content_type='application/json'
+                )
+                self.assertEqual(response.status_code, 400)
 
     def test_get_theme_api(self):
         """Theme can be retrieved via API."""
-        response = self.client.get(reverse('api_get_theme'))
+        response = self.client.get(API_GET_THEME_URL)
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.content)
+        data = response.json()
         self.assertIn('theme', data)
 
 
@@ -1395,22 +1665,17 @@ class ThemeAPITests(TestCase):
 
 from io import BytesIO
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import DatabaseError, connection
+from django.test.utils import CaptureQueriesContext
 
 
-class DeckImportTests(TestCase):
+class DeckImportTests(LoggedInUserMixin, TestCase):
     """Tests for deck import functionality."""
 
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username='testuser', password='testpass123'
-        )
-        self.client.login(username='testuser', password='testpass123')
-
     def test_import_no_file_uploaded(self):
         """Import should fail when no file is uploaded."""
-        response = self.client.post(reverse('deck_import'))
-        self.assertRedirects(response, reverse('deck_list'))
+        response = self.client.post(DECK_IMPORT_URL)
+        self.assertRedirects(response, DECK_LIST_URL, fetch_redirect_response=False)
         # Check for error message
         messages = list(response.wsgi_request._messages)
         self.assertTrue(any('select a file' in str(m).lower() for m in messages))
@@ -1418,19 +1683,45 @@ class DeckImportTests(TestCase):
     def test_import_non_json_file(self):
         """Import should reject non-JSON files."""
         file = SimpleUploadedFile('deck.txt', b'not json', content_type='text/plain')
-        response = self.client.post(reverse('deck_import'), {'deck_file': file})
-        self.assertRedirects(response, reverse('deck_list'))
+        response = self.client.post(DECK_IMPORT_URL, {'deck_file': file})
+        self.assertRedirects(response, DECK_LIST_URL, fetch_redirect_response=False)
         messages = list(response.wsgi_request._messages)
         self.assertTrue(any('json file' in str(m).lower() for m in messages))
 
     def test_import_invalid_json_content(self):
         """Import should handle malformed JSON."""
         file = SimpleUploadedFile('deck.json', b'{ invalid json }', content_type='application/json')
-        response = self.client.post(reverse('deck_import'), {'deck_file': file})
-        self.assertRedirects(response, reverse('deck_list'))
+        response = self.client.post(DECK_IMPORT_URL, {'deck_file': file})
+        self.assertRedirects(response, DECK_LIST_URL, fetch_redirect_response=False)
         messages = list(response.wsgi_request._messages)
         self.assertTrue(any('invalid json' in str(m).lower() for m in messages))
 
+    def test_import_non_utf8_content(self):
+        """Import should reject bytes that are not valid UTF-8."""
+        utf16 = json.dumps({'name': 'UTF-16 Deck', 'cards': []}).encode('utf-16')
+        for content in (b'{"name": "\xff"}', utf16):
+            with self.subTest(content=content[:8]):
+                file = SimpleUploadedFile('deck.json', content, content_type='application/json')
+                response = self.client.post(DECK_IMPORT_URL, {'deck_file': file})
+                self.assertRedirects(response, DECK_LIST_URL, fetch_redirect_response=False)
+                messages = list(response.wsgi_request._messages)
+                self.assertTrue(any('invalid json' in str(m).lower() for m in messages))
+        self.assertFalse(Deck.objects.filter(name='UTF-16 Deck').exists())
+
+    def test_import_top_level_not_an_object(self):
+        """Import should reject JSON that isn't an object before reading keys."""
+        for payload in (['name', 'cards'], 'name cards', 42):
+            with self.subTest(payload=payload):
+                file = SimpleUploadedFile(
+                    'deck.json',
+                    json.dumps(payload).encode('utf-8'),
+                    content_type='application/json'
+                )
+                response = self.client.post(DECK_IMPORT_URL, {'deck_file': file})
+                self.assertRedirects(response, DECK_LIST_URL, fetch_redirect_response=False)
+                messages = list(response.wsgi_request._messages)
+                self.assertTrue(any('json object' in str(m).lower() for m in messages))
+
     def test_import_missing_name_field(self):
         """Import should fail when name field is missing."""
         data = {'cards': []}
@@ -1439,8 +1730,8 @@ class DeckImportTests(TestCase):
             json.dumps(data).encode('utf-8'),
             content_type='application/json'
         )
-        response = self.client.post(reverse('deck_import'), {'deck_file': file})
-        self.assertRedirects(response, reverse('deck_list'))
+        response = self.client.post(DECK_IMPORT_URL, {'deck_file': file})
+        self.assertRedirects(response, DECK_LIST_URL, fetch_redirect_response=False)
         messages = list(response.wsgi_request._messages)
         self.assertTrue(any('missing "name"' in str(m).lower() for m in messages))
 
@@ -1452,8 +1743,8 @@ class DeckImportTests(TestCase):
             json.dumps(data).encode('utf-8'),
             content_type='application/json'
         )
-        response = self.client.post(reverse('deck_import'), {'deck_file': file})
-        self.assertRedirects(response, reverse('deck_list'))
+        response = self.client.post(DECK_IMPORT_URL, {'deck_file': file})
+        self.assertRedirects(response, DECK_LIST_URL, fetch_redirect_response=False)
         messages = list(response.wsgi_request._messages)
         self.assertTrue(any('cards' in str(m).lower() for m in messages))
 
@@ -1465,8 +1756,8 @@ class DeckImportTests(TestCase):
             json.dumps(data).encode('utf-8'),
             content_type='application/json'
         )
-        response = self.client.post(reverse('deck_import'), {'deck_file': file})
-        self.assertRedirects(response, reverse('deck_list'))
+        response = self.client.post(DECK_IMPORT_URL, {'deck_file': file})
+        self.assertRedirects(response, DECK_LIST_URL, fetch_redirect_response=False)
         messages = list(response.wsgi_request._messages)
         self.assertTrue(any('cards' in str(m).lower() for m in messages))
 
@@ -1484,7 +1775,7 @@ class DeckImportTests(TestCase):
             json.dumps(data).encode('utf-8'),
             content_type='application/json'
         )
-        response = self.client.post(reverse('deck_import'), {'deck_file': file})
+        response = self.client.post(DECK_IMPORT_URL, {'deck_file': file})
 
         # Should create deck with "(1)" suffix
         self.assertTrue(Deck.objects.filter(name='Imported Deck (1)', owner=self.user).exists())
@@ -1504,11 +1795,29 @@ class DeckImportTests(TestCase):
             json.dumps(data).encode('utf-8'),
             content_type='application/json'
         )
-        response = self.client.post(reverse('deck_import'), {'deck_file': file})
+        response = self.client.post(DECK_IMPORT_URL, {'deck_file': file})
 
         # Should create deck with "(2)" suffix
         self.assertTrue(Deck.objects.filter(name='Test (2)', owner=self.user).exists())
 
+    def test_import_duplicate_name_fills_first_gap(self):
+        """The first free suffix is used; other users' decks don't count."""
+        other_user = create_test_user(username='other')
+        Deck.objects.bulk_create([
+            Deck(name='Test', owner=self.user),
+            Deck(name='Test (1)', owner=self.user),
+            Deck(name='Test (3)', owner=self.user),
+            Deck(name='Test (2)', owner=other_user),
+        ])
+        file = SimpleUploadedFile(
+            'deck.json',
+            json.dumps({'name': 'Test', 'cards': []}).encode('utf-8'),
+            content_type='application/json'
+        )
+        self.client.post(DECK_IMPORT_URL, {'deck_file': file})
+
+        self.assertTrue(Deck.objects.filter(name='Test (2)', owner=self.user).exists())
+
     def test_import_invalid_card_type_defaults_to_basic(self):
         """Import should default invalid card_type to 'basic'."""
         data = {
@@ -1520,12 +1829,32 @@ class DeckImportTests(TestCase):
             json.dumps(data).encode('utf-8'),
             content_type='application/json'
         )
-        response = self.client.post(reverse('deck_import'), {'deck_file': file})
+        response = self.client.post(DECK_IMPORT_URL, {'deck_file': file})
 
         deck = Deck.objects.get(name='Type Test', owner=self.user)
         card = deck.cards.first()
         self.assertEqual(card.card_type, 'basic')
 
+    def test_import_non_string_card_type_defaults_to_basic(self):
+        """Import should default a list or object card_type to 'basic'."""
+        for card_type in (['cloze'], {'type': 'cloze'}):
+            with self.subTest(card_type=card_type):
+                name = f'Type Test {type(card_type).__name__}'
+                data = {
+                    'name': name,
+                    'cards': [{'front': 'Q1', 'back': 'A1', 'card_type': card_type}]
+                }
+                file = SimpleUploadedFile(
+                    'deck.json',
+                    json.dumps(data).encode('utf-8'),
+                    content_type='application/json'
+                )
+                response = self.client.post(DECK_IMPORT_URL, {'deck_file': file})
+
+                self.assertEqual(response.status_code, 302)
+                card = Deck.objects.get(name=name, owner=self.user).cards.get()
+                self.assertEqual(card.card_type, 'basic')
+
     def test_import_card_without_front_skipped(self):
         """Import should skip cards without 'front' field."""
         data = {
@@ -1541,7 +1870,7 @@ class DeckImportTests(TestCase):
             json.dumps(data).encode('utf-8'),
             content_type='application/json'
         )
-        response = self.client.post(reverse('deck_import'), {'deck_file': file})
+        response = self.client.post(DECK_IMPORT_URL, {'deck_file': file})
 
         deck = Deck.objects.get(name='Skip Test', owner=self.user)
         self.assertEqual(deck.cards.count(), 2)  # Only 2 valid cards
@@ -1557,7 +1886,7 @@ class DeckImportTests(TestCase):
             json.dumps(data).encode('utf-8'),
             content_type='application/json'
         )
-        response = self.client.post(reverse('deck_import'), {'deck_file': file})
+        response = self.client.post(DECK_IMPORT_URL, {'deck_file': file})
 
         deck = Deck.objects.get(name='Cloze Test', owner=self.user)
         card = deck.cards.first()
@@ -1575,10 +1904,12 @@ class DeckImportTests(TestCase):
             json.dumps(data).encode('utf-8'),
             content_type='application/json'
         )
-        response = self.client.post(reverse('deck_import'), {'deck_file': file})
+        response = self.client.post(DECK_IMPORT_URL, {'deck_file': file})
 
         deck = Deck.objects.get(name='Success Deck', owner=self.user)
-        self.assertRedirects(response, reverse('deck_detail', kwargs={'pk': deck.pk}))
+        self.assertRedirects(
+            response, reverse('deck_detail', kwargs={'pk': deck.pk}), fetch_redirect_response=False
+        )
 
     def test_import_preserves_description(self):
         """Import should preserve deck description."""
@@ -1592,7 +1923,7 @@ class DeckImportTests(TestCase):
             json.dumps(data).encode('utf-8'),
             content_type='application/json'
         )
-        response = self.client.post(reverse('deck_import'), {'deck_file': file})
+        response = self.client.post(DECK_IMPORT_URL, {'deck_file': file})
 
         deck = Deck.objects.get(name='Desc Test', owner=self.user)
         self.assertEqual(deck.description, 'My description')
@@ -1608,7 +1939,7 @@ class DeckImportTests(TestCase):
             json.dumps(data).encode('utf-8'),
             content_type='application/json'
         )
-        response = self.client.post(reverse('deck_import'), {'deck_file': file})
+        response = self.client.post(DECK_IMPORT_URL, {'deck_file': file})
 
         deck = Deck.objects.get(name='No Type', owner=self.user)
         card = deck.cards.first()
@@ -1625,99 +1956,110 @@ class DeckImportTests(TestCase):
             json.dumps(data).encode('utf-8'),
             content_type='application/json'
         )
-        response = self.client.post(reverse('deck_import'), {'deck_file': file})
+        response = self.client.post(DECK_IMPORT_URL, {'deck_file': file})
 
         deck = Deck.objects.get(name='Notes Test', owner=self.user)
         card = deck.cards.first()
         self.assertEqual(card.notes, 'My notes')
 
+    def test_import_inserts_cards_in_one_statement(self):
+        """All imported cards are written with a single INSERT."""
+        data = {
+            'name': 'Bulk Test',
+            'cards': [{'front': f'Q{i}', 'back': f'A{i}'} for i in range(20)]
+        }
+        file = SimpleUploadedFile(
+            'deck.json',
+            json.dumps(data).encode('utf-8'),
+            content_type='application/json'
+        )
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.post(DECK_IMPORT_URL, {'deck_file': file})
+
+        card_table = Card._meta.db_table
+        inserts = [q for q in ctx.captured_queries if q['sql'].startswith(f'INSERT INTO "{card_table}"')]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(Deck.objects.get(name='Bulk Test').cards.count(), 20)
+
 
 # =============================================================================
 # Dashboard Streak Tests
 # =============================================================================
 
-class DashboardStreakTests(TestCase):
+class DashboardStreakTests(LoggedInDeckMixin, TestCase):
     """Tests for dashboard streak calculations."""
 
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username='testuser', password='testpass123'
-        )
-        self.deck = Deck.objects.create(name='Test Deck', owner=self.user)
-        self.card = Card.objects.create(
-            deck=self.deck,
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.card = Card.objects.create(
+            deck=cls.deck,
             front='Test Q',
             back='Test A'
         )
-        self.client.login(username='testuser', password='testpass123')
         # Get or create user preferences
-        from .models import UserPreferences
-        self.prefs, _ = UserPreferences.objects.get_or_create(user=self.user)
+        cls.prefs, _ = UserPreferences.objects.get_or_create(user=cls.user)
 
-    def _create_review_on_date(self, date):
-        """Helper to create a review log on a specific date."""
-        review = ReviewLog.objects.create(
-            card=self.card,
-            quality=4,
-            ease_factor_before=2.5,
-            ease_factor_after=2.5,
-            interval_before=1,
-            interval_after=6
-        )
-        # Update the reviewed_at timestamp directly
-        ReviewLog.objects.filter(pk=review.pk).update(
-            reviewed_at=timezone.make_aware(datetime.combine(date, datetime.min.time()))
-        )
-        return review
+    def _create_reviews_on_dates(self, *dates):
+        """Helper to create one review log per date in a single INSERT."""
+        return ReviewLog.objects.bulk_create([
+            ReviewLog(
+                card=self.card,
+                quality=4,
+                ease_factor_before=2.5,
+                ease_factor_after=2.5,
+                interval_before=1,
+                interval_after=6,
+                reviewed_at=timezone.make_aware(datetime.combine(date, datetime.min.time()))
+            )
+            for date in dates
+        ])
 
     def _set_streak_state(self, current_streak, longest_streak, last_study_date):
         """Helper to set the user's streak state directly."""
         self.prefs.current_streak = current_streak
         self.prefs.longest_streak = longest_streak
         self.prefs.last_study_date = last_study_date
-        self.prefs.save()
+        self.prefs.save(update_fields=['current_streak', 'longest_streak', 'last_study_date'])
 
     def test_streak_with_no_reviews(self):
         """Streak should be 0 with no review history."""
         # UserPreferences defaults to current_streak=0, longest_streak=0
-        response = self.client.get(reverse('dashboard'))
+        response = self.client.get(DASHBOARD_URL)
         self.assertEqual(response.context['streak'], 0)
         self.assertEqual(response.context['longest_streak'], 0)
 
     def test_streak_with_today_only(self):
         """Streak should be 1 with only today's review."""
         today = timezone.now().date()
-        self._create_review_on_date(today)
+        self._create_reviews_on_dates(today)
         # Simulate what happens when user reviews: streak is updated
         self._set_streak_state(current_streak=1, longest_streak=1, last_study_date=today)
 
-        response = self.client.get(reverse('dashboard'))
+        response = self.client.get(DASHBOARD_URL)
         self.assertEqual(response.context['streak'], 1)
 
     def test_streak_consecutive_days(self):
         """Streak should count consecutive days."""
         today = timezone.now().date()
-        for i in range(5):
-            self._create_review_on_date(today - timedelta(days=i))
+        self._create_reviews_on_dates(*(today - timedelta(days=i) for i in range(5)))
         # Simulate 5-day streak ending today
         self._set_streak_state(current_streak=5, longest_streak=5, last_study_date=today)
 
-        response = self.client.get(reverse('dashboard'))
+        response = self.client.get(DASHBOARD_URL)
         self.assertEqual(response.context['streak'], 5)
 
     def test_streak_breaks_on_gap(self):
         """Streak should stop counting when there's a gap."""
         today = timezone.now().date()
         # Reviews today and yesterday
-        self._create_review_on_date(today)
-        self._create_review_on_date(today - timedelta(days=1))
+        self._create_reviews_on_dates(today, today - timedelta(days=1))
         # Gap on day 2, then review on day 3 (doesn't matter for current streak)
-        self._create_review_on_date(today - timedelta(days=3))
+        self._create_reviews_on_dates(today - timedelta(days=3))
         # Current streak is 2 (today + yesterday), longest is 2
         self._set_streak_state(current_streak=2, longest_streak=2, last_study_date=today)
 
-        response = self.client.get(reverse('dashboard'))
+        response = self.client.get(DASHBOARD_URL)
         self.assertEqual(response.context['streak'], 2)  # Only today + yesterday
 
     def test_streak_shows_if_studied_yesterday(self):
@@ -1725,12 +2067,11 @@ class DashboardStreakTests(TestCase):
         today = timezone.now().date()
         yesterday = today - timedelta(days=1)
         # Only reviews from yesterday and before
-        self._create_review_on_date(yesterday)
-        self._create_review_on_date(today - timedelta(days=2))
+        self._create_reviews_on_dates(yesterday, today - timedelta(days=2))
         # User has a 2-day streak from yesterday
         self._set_streak_state(current_streak=2, longest_streak=2, last_study_date=yesterday)
 
-        response = self.client.get(reverse('dashboard'))
+        response = self.client.get(DASHBOARD_URL)
         # Streak is still visible (at risk) since last study was yesterday
         self.assertEqual(response.context['streak'], 2)
 
@@ -1739,75 +2080,63 @@ class DashboardStreakTests(TestCase):
         today = timezone.now().date()
         two_days_ago = today - timedelta(days=2)
         # Review from 2 days ago
-        self._create_review_on_date(two_days_ago)
+        self._create_reviews_on_dates(two_days_ago)
         # User had a streak but it's now broken (gap > 1 day)
         self._set_streak_state(current_streak=3, longest_streak=3, last_study_date=two_days_ago)
 
-        response = self.client.get(reverse('dashboard'))
+        response = self.client.get(DASHBOARD_URL)
         # Streak should be reset to 0 since gap > 1 day
         self.assertEqual(response.context['streak'], 0)
 
     def test_longest_streak_single_day(self):
         """Longest streak should be 1 with single review day."""
         today = timezone.now().date()
-        self._create_review_on_date(today - timedelta(days=10))
+        self._create_reviews_on_dates(today - timedelta(days=10))
         # User studied once, longest streak is 1
         self._set_streak_state(current_streak=0, longest_streak=1, last_study_date=today - timedelta(days=10))
 
-        response = self.client.get(reverse('dashboard'))
+        response = self.client.get(DASHBOARD_URL)
         self.assertEqual(response.context['longest_streak'], 1)
 
     def test_longest_streak_with_gaps(self):
         """Longest streak should find longest consecutive run."""
         today = timezone.now().date()
         # First streak: 3 days (days 20, 19, 18)
-        self._create_review_on_date(today - timedelta(days=20))
-        self._create_review_on_date(today - timedelta(days=19))
-        self._create_review_on_date(today - timedelta(days=18))
+        self._create_reviews_on_dates(*(today - timedelta(days=d) for d in (20, 19, 18)))
         # Gap
         # Second streak: 5 days (days 10, 9, 8, 7, 6)
-        self._create_review_on_date(today - timedelta(days=10))
-        self._create_review_on_date(today - timedelta(days=9))
-        self._create_review_on_date(today - timedelta(days=8))
-        self._create_review_on_date(today - timedelta(days=7))
-        self._create_review_on_date(today - timedelta(days=6))
+        self._create_reviews_on_dates(*(today - timedelta(days=d) for d in (10, 9, 8, 7, 6)))
         # Set stored streak values (longest was 5, current is 0 since gap > 1 day)
         self._set_streak_state(current_streak=0, longest_streak=5, last_study_date=today - timedelta(days=6))
 
-        response = self.client.get(reverse('dashboard'))
+        response = self.client.get(DASHBOARD_URL)
         self.assertEqual(response.context['longest_streak'], 5)
 
     def test_longest_streak_at_end_of_sequence(self):
         """Longest streak at end of review dates should be detected."""
         today = timezone.now().date()
         # Short streak first
-        self._create_review_on_date(today - timedelta(days=30))
-        self._create_review_on_date(today - timedelta(days=29))
+        self._create_reviews_on_dates(today - timedelta(days=30), today - timedelta(days=29))
         # Gap
         # Longer streak at end (current)
-        self._create_review_on_date(today - timedelta(days=3))
-        self._create_review_on_date(today - timedelta(days=2))
-        self._create_review_on_date(today - timedelta(days=1))
-        self._create_review_on_date(today)
+        self._create_reviews_on_dates(*(today - timedelta(days=d) for d in (3, 2, 1, 0)))
         # Set stored streak values (current 4-day streak ending today)
         self._set_streak_state(current_streak=4, longest_streak=4, last_study_date=today)
 
-        response = self.client.get(reverse('dashboard'))
+        response = self.client.get(DASHBOARD_URL)
         self.assertEqual(response.context['longest_streak'], 4)
 
     def test_multiple_reviews_same_day_count_once(self):
         """Multiple reviews on same day should count as one day in streak."""
         today = timezone.now().date()
         # Multiple reviews today
-        self._create_review_on_date(today)
-        self._create_review_on_date(today)
-        self._create_review_on_date(today)
+        self._create_reviews_on_dates(today, today, today)
         # One review yesterday
-        self._create_review_on_date(today - timedelta(days=1))
+        self._create_reviews_on_dates(today - timedelta(days=1))
         # Set stored streak values (2-day streak: today + yesterday)
         self._set_streak_state(current_streak=2, longest_streak=2, last_study_date=today)
 
-        response = self.client.get(reverse('dashboard'))
+        response = self.client.get(DASHBOARD_URL)
         self.assertEqual(response.context['streak'], 2)  # Not 4
 
     def test_dashboard_shows_retention_rate(self):
@@ -1823,31 +2152,33 @@ class DashboardStreakTests(TestCase):
                 interval_after=6
             )
 
-        response = self.client.get(reverse('dashboard'))
+        response = self.client.get(DASHBOARD_URL)
         # 3 out of 4 = 75%
         self.assertEqual(response.context['retention_rate'], 75.0)
 
     def test_dashboard_card_maturity_classification(self):
         """Dashboard should classify cards by maturity correctly."""
-        # New card (has_been_reviewed=False) - already exists from setUp
-        # Learning card (has_been_reviewed=True, interval < 21)
-        learning_card = Card.objects.create(
-            deck=self.deck,
-            front='Learning',
-            repetitions=2,
-            interval=10,
-            has_been_reviewed=True
-        )
-        # Mature card (interval >= 21)
-        mature_card = Card.objects.create(
-            deck=self.deck,
-            front='Mature',
-            repetitions=5,
-            interval=30,
-            has_been_reviewed=True
-        )
-
-        response = self.client.get(reverse('dashboard'))
+        Card.objects.bulk_create([
+            # New card (has_been_reviewed=False) - already exists from setUp
+            # Learning card (has_been_reviewed=True, interval < 21)
+            Card(
+                deck=self.deck,
+                front='Learning',
+                repetitions=2,
+                interval=10,
+                has_been_reviewed=True
+            ),
+            # Mature card (interval >= 21)
+            Card(
+                deck=self.deck,
+                front='Mature',
+                repetitions=5,
+                interval=30,
+                has_been_reviewed=True
+            ),
+        ])
+
+        response = self.client.get(DASHBOARD_URL)
         self.assertEqual(response.context['cards_new'], 1)
         self.assertEqual(response.context['cards_learning'], 1)
         self.assertEqual(response.context['cards_mature'], 1)
@@ -1860,22 +2191,19 @@ class DashboardStreakTests(TestCase):
 from unittest.mock import patch, MagicMock
 from django.core.management import call_command
 from io import StringIO
-from cards.models import ReviewReminder
+from cards.management.commands.send_reminders import Command
 
 
 class SendRemindersCommandTests(TestCase):
     """Tests for the send_reminders management command."""
 
-    def setUp(self):
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123'
-        )
-        self.deck = Deck.objects.create(name='Test Deck', owner=self.user)
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_test_user(username='testuser', email='test@example.com')
+        cls.deck = Deck.objects.create(name='Test Deck', owner=cls.user)
         # Create a due card (must have has_been_reviewed=True to be considered "due" not "new")
-        self.card = Card.objects.create(
-            deck=self.deck,
+        cls.card = Card.objects.create(
+            deck=cls.deck,
             front='Test Q',
             back='Test A',
             next_review=timezone.now() - timedelta(hours=1),
@@ -1886,11 +2214,10 @@ class SendRemindersCommandTests(TestCase):
         # Since user_timezone defaults to UTC, we use UTC time
         current_time = timezone.now().time()
         # Create user preferences (required for timezone handling)
-        from .models import UserPreferences
-        self.prefs, _ = UserPreferences.objects.get_or_create(user=self.user)
+        cls.prefs, _ = UserPreferences.objects.get_or_create(user=cls.user)
 
-        self.reminder = ReviewReminder.objects.create(
-            user=self.user,
+        cls.reminder = ReviewReminder.objects.create(
+            user=cls.user,
             enabled=True,
             frequency=ReviewReminder.Frequency.DAILY,
             preferred_time=current_time
@@ -1898,7 +2225,6 @@ class SendRemindersCommandTests(TestCase):
 
     def test_should_send_today_daily(self):
         """Daily frequency should always return True."""
-        from cards.management.commands.send_reminders import Command
         cmd = Command()
         self.reminder.frequency = ReviewReminder.Frequency.DAILY
 
@@ -1909,7 +2235,6 @@ class SendRemindersCommandTests(TestCase):
 
     def test_should_send_today_weekly_monday(self):
         """Weekly frequency should only return True on Monday (day 0)."""
-        from cards.management.commands.send_reminders import Command
         cmd = Command()
         self.reminder.frequency = ReviewReminder.Frequency.WEEKLY
 
@@ -1925,7 +2250,6 @@ class SendRemindersCommandTests(TestCase):
 
     def test_should_send_today_custom_days(self):
         """Custom frequency should only return True on specified days."""
-        from cards.management.commands.send_reminders import Command
         cmd = Command()
         self.reminder.frequency = ReviewReminder.Frequency.CUSTOM
         self.reminder.custom_days = '0,2,4'  # Monday, Wednesday, Friday
@@ -1943,7 +2267,6 @@ class SendRemindersCommandTests(TestCase):
 
     def test_should_send_today_custom_empty(self):
         """Custom frequency with empty days should return False."""
-        from cards.management.commands.send_reminders import Command
         cmd = Command()
         self.reminder.frequency = ReviewReminder.Frequency.CUSTOM
         self.reminder.custom_days = ''
@@ -1953,8 +2276,6 @@ class SendRemindersCommandTests(TestCase):
 
     def test_is_within_preferred_time_exact_match(self):
         """Should return True when current time matches preferred time."""
-        from cards.management.commands.send_reminders import Command
-        from datetime import time
         cmd = Command()
 
         self.reminder.preferred_time = time(9, 0)
@@ -1964,8 +2285,6 @@ class SendRemindersCommandTests(TestCase):
 
     def test_is_within_preferred_time_within_window(self):
         """Should return True when within the time window."""
-        from cards.management.commands.send_reminders import Command
-        from datetime import time
         cmd = Command()
 
         self.reminder.preferred_time = time(9, 0)
@@ -1980,8 +2299,6 @@ class SendRemindersCommandTests(TestCase):
 
     def test_is_within_preferred_time_outside_window(self):
         """Should return False when outside the time window."""
-        from cards.management.commands.send_reminders import Command
-        from datetime import time
         cmd = Command()
 
         self.reminder.preferred_time = time(9, 0)
@@ -1996,8 +2313,6 @@ class SendRemindersCommandTests(TestCase):
 
     def test_is_within_preferred_time_midnight_wraparound(self):
         """Should handle midnight wraparound correctly."""
-        from cards.management.commands.send_reminders import Command
-        from datetime import time
         cmd = Command()
 
         # Preferred time near midnight
@@ -2014,16 +2329,15 @@ class SendRemindersCommandTests(TestCase):
     @patch('cards.management.commands.send_reminders.send_branded_email')
     def test_handle_skips_outside_time_window(self, mock_send_email):
         """Should skip users when outside their preferred time window."""
-        from datetime import time
 
         # Set preferred time to 9:00 AM
         self.reminder.preferred_time = time(9, 0)
-        self.reminder.save()
+        self.reminder.save(update_fields=['preferred_time'])
 
         # Mock current time to 2:00 PM (5 hours after preferred time)
         afternoon = datetime(2025, 12, 1, 14, 0, 0, tzinfo=dt_timezone.utc)
         self.card.next_review = afternoon - timedelta(hours=1)
-        self.card.save()
+        self.card.save(update_fields=['next_review'])
 
         with patch('cards.management.commands.send_reminders.timezone.now', return_value=afternoon):
             out = StringIO()
@@ -2035,16 +2349,15 @@ class SendRemindersCommandTests(TestCase):
     @patch('cards.management.commands.send_reminders.send_branded_email')
     def test_handle_time_window_argument(self, mock_send_email):
         """Should respect custom time window argument."""
-        from datetime import time
 
         # Set preferred time to 9:00 AM
         self.reminder.preferred_time = time(9, 0)
-        self.reminder.save()
+        self.reminder.save(update_fields=['preferred_time'])
 
         # Mock current time to 10:00 AM (60 minutes after preferred time)
         morning = datetime(2025, 12, 1, 10, 0, 0, tzinfo=dt_timezone.utc)
         self.card.next_review = morning - timedelta(hours=1)
-        self.card.save()
+        self.card.save(update_fields=['next_review'])
 
         with patch('cards.management.commands.send_reminders.timezone.now', return_value=morning):
             # With default 30-minute window, should NOT send
@@ -2059,7 +2372,6 @@ class SendRemindersCommandTests(TestCase):
 
     def test_get_due_cards_count(self):
         """Should count due cards for user."""
-        from cards.management.commands.send_reminders import Command
         cmd = Command()
 
         # One card is already due from setUp
@@ -2087,12 +2399,9 @@ class SendRemindersCommandTests(TestCase):
 
     def test_get_due_cards_count_other_user(self):
         """Should only count cards belonging to the specified user."""
-        from cards.management.commands.send_reminders import Command
         cmd = Command()
 
-        other_user = User.objects.create_user(
-            username='other', email='other@example.com', password='pass'
-        )
+        other_user = create_test_user(username='other', email='other@example.com')
         other_deck = Deck.objects.create(name='Other Deck', owner=other_user)
         Card.objects.create(
             deck=other_deck,
@@ -2108,7 +2417,6 @@ class SendRemindersCommandTests(TestCase):
     @patch('cards.management.commands.send_reminders.send_branded_email')
     def test_send_reminder_email(self, mock_send_email):
         """Should send email with correct content."""
-        from cards.management.commands.send_reminders import Command
         cmd = Command()
         cmd.stdout = StringIO()
 
@@ -2123,7 +2431,6 @@ class SendRemindersCommandTests(TestCase):
     @patch('cards.management.commands.send_reminders.send_branded_email')
     def test_send_reminder_email_singular(self, mock_send_email):
         """Should use singular 'flashcard' for count of 1."""
-        from cards.management.commands.send_reminders import Command
         cmd = Command()
         cmd.stdout = StringIO()
 
@@ -2146,6 +2453,59 @@ class SendRemindersCommandTests(TestCase):
         self.reminder.refresh_from_db()
         self.assertIsNotNone(self.reminder.last_sent)
 
+    @patch('cards.management.commands.send_reminders.send_branded_email')
+    def test_handle_logs_sent_reminders(self, mock_send_email):
+        """Handle should write one EmailLog per reminder sent."""
+
+        call_command('send_reminders', stdout=StringIO())
+
+        logs = EmailLog.objects.filter(user=self.user)
+        self.assertEqual(logs.count(), 1)
+        self.assertEqual(logs.first().email_type, EmailLog.EmailType.STUDY_REMINDER)
+
+        # Second run the same day is deduplicated by the logged entry
+        call_command('send_reminders', stdout=StringIO())
+        mock_send_email.assert_called_once()
+
+    @patch('cards.management.commands.send_reminders.EMAIL_LOG_BATCH_SIZE', 1)
+    @patch('cards.management.commands.send_reminders.send_branded_email')
+    def test_handle_writes_logs_as_batches_fill(self, mock_send_email):
+        """Full batches of EmailLog entries are written during the run, not only at the end."""
+        other = create_test_user(username='otheruser', email='other@example.com')
+        other_deck = Deck.objects.create(name='Other Deck', owner=other)
+        Card.objects.create(
+            deck=other_deck, front='Q', back='A',
+            next_review=self.card.next_review, has_been_reviewed=True
+        )
+        ReviewReminder.objects.create(
+            user=other, enabled=True,
+            frequency=ReviewReminder.Frequency.DAILY,
+            preferred_time=self.reminder.preferred_time
+        )
+        logged_before_send = []
+        mock_send_email.side_effect = lambda **kwargs: logged_before_send.append(
+            EmailLog.objects.count()
+        )
+
+        call_command('send_reminders', stdout=StringIO())
+
+        self.assertEqual(logged_before_send, [0, 1])
+        self.assertEqual(EmailLog.objects.count(), 2)
+
+    @patch('cards.management.commands.send_reminders.EMAIL_LOG_BATCH_SIZE', 1)
+    @patch('cards.management.commands.send_reminders.send_branded_email')
+    def test_handle_log_write_failure_is_not_a_send_failure(self, mock_send_email):
+        """A failed EmailLog write is raised once, not reported as a failed send."""
+        err = StringIO()
+        with patch('cards.email.EmailLog.objects.bulk_create', side_effect=DatabaseError) as mock_write:
+            with self.assertRaises(DatabaseError):
+                call_command('send_reminders', stdout=StringIO(), stderr=err)
+
+        mock_write.assert_called_once()
+        self.assertNotIn('Failed to send email', err.getvalue())
+        self.reminder.refresh_from_db()
+        self.assertIsNotNone(self.reminder.last_sent)
+
     @patch('cards.management.commands.send_reminders.send_branded_email')
     def test_handle_dry_run(self, mock_send_email):
         """Dry run should not send emails."""
@@ -2160,7 +2520,7 @@ class SendRemindersCommandTests(TestCase):
     def test_handle_skips_disabled_reminders(self, mock_send_email):
         """Should skip users with disabled reminders."""
         self.reminder.enabled = False
-        self.reminder.save()
+        self.reminder.save(update_fields=['enabled'])
 
         out = StringIO()
         call_command('send_reminders', stdout=out)
@@ -2173,7 +2533,7 @@ class SendRemindersCommandTests(TestCase):
         """Should skip users with no cards due."""
         # Make the card not due
         self.card.next_review = timezone.now() + timedelta(days=1)
-        self.card.save()
+        self.card.save(update_fields=['next_review'])
 
         out = StringIO()
         call_command('send_reminders', stdout=out)
@@ -2185,7 +2545,7 @@ class SendRemindersCommandTests(TestCase):
     def test_handle_skips_wrong_day_weekly(self, mock_send_email):
         """Should skip weekly reminders on non-Monday."""
         self.reminder.frequency = ReviewReminder.Frequency.WEEKLY
-        self.reminder.save()
+        self.reminder.save(update_fields=['frequency'])
 
         # Create a fake Tuesday datetime
         # Start from a known Monday and add 1 day
@@ -2194,11 +2554,11 @@ class SendRemindersCommandTests(TestCase):
 
         # Make the card due relative to this mocked time
         self.card.next_review = tuesday - timedelta(hours=1)
-        self.card.save()
+        self.card.save(update_fields=['next_review'])
 
         # Set preferred_time to match the mocked time
         self.reminder.preferred_time = tuesday.time()
-        self.reminder.save()
+        self.reminder.save(update_fields=['preferred_time'])
 
         with patch('cards.management.commands.send_reminders.timezone.now', return_value=tuesday):
             out = StringIO()
@@ -2210,18 +2570,18 @@ class SendRemindersCommandTests(TestCase):
     def test_handle_sends_on_monday_weekly(self, mock_send_email):
         """Should send weekly reminders on Monday."""
         self.reminder.frequency = ReviewReminder.Frequency.WEEKLY
-        self.reminder.save()
+        self.reminder.save(update_fields=['frequency'])
 
         # Create a fake Monday datetime
         monday = datetime(2025, 12, 1, 12, 0, 0, tzinfo=dt_timezone.utc)  # Monday Dec 1, 2025
 
         # Make the card due relative to this mocked time
         self.card.next_review = monday - timedelta(hours=1)
-        self.card.save()
+        self.card.save(update_fields=['next_review'])
 
         # Set preferred_time to match the mocked time
         self.reminder.preferred_time = monday.time()
-        self.reminder.save()
+        self.reminder.save(update_fields=['preferred_time'])
 
         with patch('cards.management.commands.send_reminders.timezone.now', return_value=monday):
             out = StringIO()
@@ -2232,13 +2592,9 @@ class SendRemindersCommandTests(TestCase):
     @patch('cards.management.commands.send_reminders.send_branded_email')
     def test_handle_multiple_users(self, mock_send_email):
         """Should handle multiple users with reminders."""
-        from cards.models import UserPreferences as UP
         current_time = timezone.now().time()  # UTC time to match user's default timezone
         # Create second user with reminder and due cards
-        user2 = User.objects.create_user(
-            username='user2', email='user2@example.com', password='pass'
-        )
-        UP.objects.create(user=user2)
+        user2 = create_test_user(username='user2', email='user2@example.com')
         deck2 = Deck.objects.create(name='Deck 2', owner=user2)
         Card.objects.create(
             deck=deck2,
@@ -2261,6 +2617,53 @@ class SendRemindersCommandTests(TestCase):
         self.assertIn('Sent 2 reminder', out.getvalue())
 
 
+class EmailLogModelTests(TestCase):
+    """Tests for EmailLog deduplication helpers."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_test_user(username='testuser')
+        cls.log = EmailLog.objects.create(
+            user=cls.user,
+            email_type=EmailLog.EmailType.STUDY_REMINDER,
+            subject='Reminder',
+        )
+
+    def test_was_sent_today(self):
+        """A log from today counts as sent today."""
+        self.assertTrue(EmailLog.was_sent_today(self.user, EmailLog.EmailType.STUDY_REMINDER))
+        self.assertFalse(EmailLog.was_sent_today(self.user, EmailLog.EmailType.STREAK_REMINDER))
+
+    def test_was_sent_today_ignores_yesterday(self):
+        """A log from before midnight does not count as sent today."""
+        yesterday = timezone.localdate() - timedelta(days=1)
+        EmailLog.objects.filter(pk=self.log.pk).update(
+            sent_at=timezone.make_aware(datetime.combine(yesterday, datetime.max.time()))
+        )
+        self.assertFalse(EmailLog.was_sent_today(self.user, EmailLog.EmailType.STUDY_REMINDER))
+
+
+class CommandExecutionLogModelTests(TestCase):
+    """Tests for CommandExecutionLog lookups."""
+
+    def test_last_run_ordered_by_start_time(self):
+        """get_last_run/get_last_success pick the latest start, not the latest row."""
+        now = timezone.now()
+        newer = CommandExecutionLog.objects.create(
+            command_name='send_reminders',
+            status=CommandExecutionLog.Status.SUCCESS,
+            started_at=now,
+        )
+        CommandExecutionLog.objects.create(
+            command_name='send_reminders',
+            status=CommandExecutionLog.Status.SUCCESS,
+            started_at=now - timedelta(hours=1),
+        )
+
+        self.assertEqual(CommandExecutionLog.get_last_run('send_reminders'), newer)
+        self.assertEqual(CommandExecutionLog.get_last_success('send_reminders'), newer)
+
+
 # =============================================================================
 # Email Verification Tests
 # =============================================================================
@@ -2268,17 +2671,12 @@ class SendRemindersCommandTests(TestCase):
 class EmailVerificationModelTests(TestCase):
     """Tests for EmailVerificationToken model."""
 
-    def setUp(self):
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123',
-            is_active=False
-        )
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_test_user(username='testuser', email='test@example.com', is_active=False)
 
     def test_create_for_user(self):
         """Should create a verification token for a user."""
-        from .models import EmailVerificationToken
         token = EmailVerificationToken.create_for_user(self.user)
         self.assertIsNotNone(token.token)
         self.assertEqual(token.user, self.user)
@@ -2286,43 +2684,47 @@ class EmailVerificationModelTests(TestCase):
 
     def test_create_for_user_replaces_existing(self):
         """Creating a new token should replace existing one."""
-        from .models import EmailVerificationToken
         token1 = EmailVerificationToken.create_for_user(self.user)
         token2 = EmailVerificationToken.create_for_user(self.user)
         self.assertNotEqual(token1.token, token2.token)
         self.assertEqual(EmailVerificationToken.objects.filter(user=self.user).count(), 1)
 
+    def test_create_for_user_resets_expiry(self):
+        """Replacing an expired token should give a fresh 24 hours."""
+        token = EmailVerificationToken.create_for_user(self.user)
+        token.created_at = timezone.now() - timedelta(hours=25)
+        token.save(update_fields=['created_at'])
+
+        token = EmailVerificationToken.create_for_user(self.user)
+        token.refresh_from_db()
+        self.assertFalse(token.is_expired())
+
     def test_is_expired_false_for_new_token(self):
         """New token should not be expired."""
-        from .models import EmailVerificationToken
         token = EmailVerificationToken.create_for_user(self.user)
         self.assertFalse(token.is_expired())
 
     def test_is_expired_true_after_24_hours(self):
         """Token should be expired after 24 hours."""
-        from .models import EmailVerificationToken
         token = EmailVerificationToken.create_for_user(self.user)
         token.created_at = timezone.now() - timedelta(hours=25)
-        token.save()
+        token.save(update_fields=['created_at'])
         self.assertTrue(token.is_expired())
 
 
 class EmailVerificationViewTests(TestCase):
     """Tests for email verification views."""
 
-    def setUp(self):
-        self.client = Client()
-
     def test_verification_sent_page_loads(self):
         """Verification sent page should load."""
-        response = self.client.get(reverse('verification_sent'))
+        response = self.client.get(VERIFICATION_SENT_URL)
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'Check your email')
 
     @patch('cards.views.auth.send_branded_email')
     def test_register_sends_verification_email(self, mock_send_email):
         """Registration should send verification email."""
-        self.client.post(reverse('register'), {
+        self.client.post(REGISTER_URL, {
             'username': 'newuser',
             'email': 'new@example.com',
             'password1': 'SecurePass123!',
@@ -2335,17 +2737,11 @@ class EmailVerificationViewTests(TestCase):
 
     def test_verify_email_activates_user(self):
         """Clicking verification link should activate user."""
-        from .models import EmailVerificationToken
-        user = User.objects.create_user(
-            username='newuser',
-            email='new@example.com',
-            password='testpass123',
-            is_active=False
-        )
+        user = create_test_user(username='newuser', email='new@example.com', is_active=False)
         token = EmailVerificationToken.create_for_user(user)
 
         response = self.client.get(reverse('verify_email', args=[token.token]))
-        self.assertRedirects(response, reverse('login'))
+        self.assertRedirects(response, LOGIN_URL, fetch_redirect_response=False)
 
         user.refresh_from_db()
         self.assertTrue(user.is_active)
@@ -2353,16 +2749,10 @@ class EmailVerificationViewTests(TestCase):
 
     def test_verify_email_expired_token(self):
         """Expired token should show expired page."""
-        from .models import EmailVerificationToken
-        user = User.objects.create_user(
-            username='newuser',
-            email='new@example.com',
-            password='testpass123',
-            is_active=False
-        )
+        user = create_test_user(username='newuser', email='new@example.com', is_active=False)
         token = EmailVerificationToken.create_for_user(user)
         token.created_at = timezone.now() - timedelta(hours=25)
-        token.save()
+        token.save(update_fields=['created_at'])
 
         response = self.client.get(reverse('verify_email', args=[token.token]))
         self.assertEqual(response.status_code, 200)
@@ -2378,63 +2768,48 @@ class EmailVerificationViewTests(TestCase):
 
     def test_resend_verification_page_loads(self):
         """Resend verification page should load."""
-        response = self.client.get(reverse('resend_verification'))
+        response = self.client.get(RESEND_VERIFICATION_URL)
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'email')
 
     @patch('cards.views.auth.send_branded_email')
     def test_resend_verification_sends_email(self, mock_send_email):
         """Resend verification should send email to unverified user."""
-        user = User.objects.create_user(
-            username='newuser',
-            email='new@example.com',
-            password='testpass123',
-            is_active=False
-        )
+        user = create_test_user(username='newuser', email='new@example.com', is_active=False)
 
-        response = self.client.post(reverse('resend_verification'), {
+        response = self.client.post(RESEND_VERIFICATION_URL, {
             'email': 'new@example.com'
         })
-        self.assertRedirects(response, reverse('verification_sent'))
+        self.assertRedirects(response, VERIFICATION_SENT_URL, fetch_redirect_response=False)
         mock_send_email.assert_called_once()
 
     @patch('cards.views.auth.send_branded_email')
     def test_resend_verification_nonexistent_email(self, mock_send_email):
         """Resend with nonexistent email should not reveal account existence."""
-        response = self.client.post(reverse('resend_verification'), {
+        response = self.client.post(RESEND_VERIFICATION_URL, {
             'email': 'nonexistent@example.com'
         })
-        self.assertRedirects(response, reverse('verification_sent'))
+        self.assertRedirects(response, VERIFICATION_SENT_URL, fetch_redirect_response=False)
         mock_send_email.assert_not_called()
 
     @patch('cards.views.auth.send_branded_email')
     def test_resend_verification_active_user(self, mock_send_email):
         """Resend for active user should not send email."""
-        User.objects.create_user(
-            username='activeuser',
-            email='active@example.com',
-            password='testpass123',
-            is_active=True
-        )
+        create_test_user(username='activeuser', email='active@example.com', is_active=True)
 
-        response = self.client.post(reverse('resend_verification'), {
+        response = self.client.post(RESEND_VERIFICATION_URL, {
             'email': 'active@example.com'
         })
-        self.assertRedirects(response, reverse('verification_sent'))
+        self.assertRedirects(response, VERIFICATION_SENT_URL, fetch_redirect_response=False)
         mock_send_email.assert_not_called()
 
     def test_inactive_user_cannot_login(self):
         """Inactive user should not be able to login."""
-        User.objects.create_user(
-            username='inactiveuser',
-            email='inactive@example.com',
-            password='testpass123',
-            is_active=False
-        )
+        create_test_user(username='inactiveuser', email='inactive@example.com', is_active=False)
 
-        response = self.client.post(reverse('login'), {
+        response = self.client.post(LOGIN_URL, {
             'username': 'inactiveuser',
-            'password': 'testpass123',
+            'password': TEST_PASSWORD,
         })
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'Please enter a correct username')
@@ -2445,21 +2820,13 @@ class EmailVerificationViewTests(TestCase):
 # =============================================================================
 
 
-class PracticeModeTests(TestCase):
+class PracticeModeTests(LoggedInDeckMixin, TestCase):
     """Tests for the practice mode feature."""
 
-    def setUp(self):
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123'
-        )
-        self.client.login(username='testuser', password='testpass123')
-        self.deck = Deck.objects.create(name='Test Deck', owner=self.user)
-
-        # Create user preferences
-        from .models import UserPreferences
-        self.prefs, _ = UserPreferences.objects.get_or_create(user=self.user)
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.prefs = cls.user.preferences
 
     def test_practice_session_shows_non_due_cards(self):
         """Practice session should show cards that aren't due yet."""
@@ -2473,15 +2840,15 @@ class PracticeModeTests(TestCase):
             repetitions=1
         )
 
-        response = self.client.get(reverse('practice_session'))
+        response = self.client.get(PRACTICE_SESSION_URL)
         self.assertEqual(response.status_code, 200)
         self.assertIn('practice_mode', response.context)
         self.assertTrue(response.context['practice_mode'])
 
     def test_practice_session_redirects_when_no_cards(self):
         """Practice session should redirect when no cards are available."""
-        response = self.client.get(reverse('practice_session'))
-        self.assertRedirects(response, reverse('dashboard'))
+        response = self.client.get(PRACTICE_SESSION_URL)
+        self.assertRedirects(response, DASHBOARD_URL, fetch_redirect_response=False)
 
     def test_practice_session_excludes_due_cards(self):
         """Practice session should not include cards that are due now."""
@@ -2495,9 +2862,9 @@ class PracticeModeTests(TestCase):
             repetitions=1
         )
 
-        response = self.client.get(reverse('practice_session'))
+        response = self.client.get(PRACTICE_SESSION_URL)
         # Should redirect since there are no non-due cards
-        self.assertRedirects(response, reverse('dashboard'))
+        self.assertRedirects(response, DASHBOARD_URL, fetch_redirect_response=False)
 
     def test_practice_session_excludes_new_cards(self):
         """Practice session should not include new cards (never reviewed)."""
@@ -2509,9 +2876,9 @@ class PracticeModeTests(TestCase):
             has_been_reviewed=False
         )
 
-        response = self.client.get(reverse('practice_session'))
+        response = self.client.get(PRACTICE_SESSION_URL)
         # Should redirect since there are no practice-eligible cards
-        self.assertRedirects(response, reverse('dashboard'))
+        self.assertRedirects(response, DASHBOARD_URL, fetch_redirect_response=False)
 
     def test_practice_card_does_not_update_srs(self):
         """Practice review should not update card SRS scheduling."""
@@ -2586,7 +2953,7 @@ class PracticeModeTests(TestCase):
         # Reset streak
         self.prefs.current_streak = 0
         self.prefs.last_study_date = None
-        self.prefs.save()
+        self.prefs.save(update_fields=['current_streak', 'last_study_date'])
 
         response = self.client.post(
             reverse('practice_card', args=[card.pk]),
@@ -2650,23 +3017,25 @@ class PracticeModeTests(TestCase):
         """Practice session should respect deck filter."""
         other_deck = Deck.objects.create(name='Other Deck', owner=self.user)
 
-        # Create cards in both decks
-        Card.objects.create(
-            deck=self.deck,
-            front='Test Deck Q',
-            back='Test Deck A',
-            next_review=timezone.now() + timedelta(days=1),
-            has_been_reviewed=True,
-            repetitions=1
-        )
-        Card.objects.create(
-            deck=other_deck,
-            front='Other Deck Q',
-            back='Other Deck A',
-            next_review=timezone.now() + timedelta(days=1),
-            has_been_reviewed=True,
-            repetitions=1
-        )
+        Card.objects.bulk_create([
+            # Create cards in both decks
+            Card(
+                deck=self.deck,
+                front='Test Deck Q',
+                back='Test Deck A',
+                next_review=timezone.now() + timedelta(days=1),
+                has_been_reviewed=True,
+                repetitions=1
+            ),
+            Card(
+                deck=other_deck,
+                front='Other Deck Q',
+                back='Other Deck A',
+                next_review=timezone.now() + timedelta(days=1),
+                has_been_reviewed=True,
+                repetitions=1
+            ),
+        ])
 
         # Request practice for specific deck
         response = self.client.get(reverse('practice_session_deck', args=[self.deck.pk]))
@@ -2678,20 +3047,13 @@ class PracticeModeTests(TestCase):
             self.assertEqual(card.deck, self.deck)
 
 
-class DashboardPracticeModeTests(TestCase):
+class DashboardPracticeModeTests(LoggedInDeckMixin, TestCase):
     """Tests for practice mode display on dashboard."""
 
-    def setUp(self):
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123'
-        )
-        self.client.login(username='testuser', password='testpass123')
-        self.deck = Deck.objects.create(name='Test Deck', owner=self.user)
-
-        from .models import UserPreferences
-        self.prefs, _ = UserPreferences.objects.get_or_create(user=self.user)
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.prefs = cls.user.preferences
 
     def test_dashboard_shows_practice_available(self):
         """Dashboard should show practice_available count when cards exist."""
@@ -2705,7 +3067,7 @@ class DashboardPracticeModeTests(TestCase):
             repetitions=1
         )
 
-        response = self.client.get(reverse('dashboard'))
+        response = self.client.get(DASHBOARD_URL)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.context['practice_available'], 1)
 
@@ -2721,33 +3083,59 @@ class DashboardPracticeModeTests(TestCase):
             repetitions=1
         )
 
-        response = self.client.get(reverse('dashboard'))
+        response = self.client.get(DASHBOARD_URL)
         self.assertEqual(response.status_code, 200)
         self.assertIsNotNone(response.context['next_review_time'])
 
     def test_dashboard_no_practice_when_cards_due(self):
         """Dashboard should count practice cards correctly when due cards exist."""
-        # Create a due card
-        Card.objects.create(
-            deck=self.deck,
-            front='Due Q',
-            back='Due A',
-            next_review=timezone.now() - timedelta(hours=1),
-            has_been_reviewed=True,
-            repetitions=1
-        )
-        # Create a future card
-        Card.objects.create(
-            deck=self.deck,
-            front='Future Q',
-            back='Future A',
-            next_review=timezone.now() + timedelta(days=1),
-            has_been_reviewed=True,
-            repetitions=1
-        )
-
-        response = self.client.get(reverse('dashboard'))
+        Card.objects.bulk_create([
+            # Create a due card
+            Card(
+                deck=self.deck,
+                front='Due Q',
+                back='Due A',
+                next_review=timezone.now() - timedelta(hours=1),
+                has_been_reviewed=True,
+                repetitions=1
+            ),
+            # Create a future card
+            Card(
+                deck=self.deck,
+                front='Future Q',
+                back='Future A',
+                next_review=timezone.now() + timedelta(days=1),
+                has_been_reviewed=True,
+                repetitions=1
+            ),
+        ])
+
+        response = self.client.get(DASHBOARD_URL)
         self.assertEqual(response.status_code, 200)
         # Should show 1 due and 1 practice available
         self.assertEqual(response.context['total_due'], 1)
         self.assertEqual(response.context['practice_available'], 1)
+
+
+# =============================================================================
+# Test Suite Checks
+# =============================================================================
+
+
+class TestSuiteTests(SimpleTestCase):
+    """Guards for how the test classes in this module are set up."""
+
+    # TransactionTestCase subclasses that really need committed transactions
+    TRANSACTION_TEST_ALLOWLIST = frozenset()
+
+    def test_database_tests_roll_back(self):
+        """DB tests use TestCase, which rolls back instead of flushing tables."""
+        offenders = [
+            name for name, obj in globals().items()
+            if isinstance(obj, type)
+            and obj.__module__ == __name__
+            and issubclass(obj, TransactionTestCase)
+            and not issubclass(obj, TestCase)
+            and name not in self.TRANSACTION_TEST_ALLOWLIST
+        ]
+        self.assertEqual(offenders, [])
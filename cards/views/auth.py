@@ -8,7 +8,7 @@ from django.views import View
 from django.views.decorators.http import require_POST
 
 from ..forms import LoginForm, RegisterForm
-from ..models import UserPreferences, EmailVerificationToken
+from ..models import EmailVerificationToken
 from ..email import send_branded_email
 from .helpers import get_or_create_preferences
 
@@ -64,9 +64,7 @@ class RegisterView(View):
         if form.is_valid():
             user = form.save(commit=False)
             user.is_active = False
-            user.save()
-            # Create default preferences
-            UserPreferences.objects.create(user=user)
+            user.save()  # post_save also creates the default preferences
             # Create verification token and send email
             token = EmailVerificationToken.create_for_user(user)
             send_verification_email(user, token, request)
@@ -3,13 +3,14 @@
 from datetime import timedelta
 
 from django.contrib.auth.decorators import login_required
-from django.db.models import Avg, Count, Q
+from django.db.models import Avg, Count, Min, Q
 from django.shortcuts import render
 from django.utils import timezone
 
 from ..models import Deck, Card, ReviewLog
 from .helpers import (
     get_or_create_preferences,
+    get_preferences_timezone,
     get_user_local_date,
     get_local_day_range,
     get_local_day_start,
@@ -21,83 +22,106 @@ def dashboard(request):
     """Main dashboard showing overview and due cards."""
     user = request.user
     now = timezone.now()
-    today = get_user_local_date(user)  # Use user's local date, not UTC
+    # Look the timezone up once and hand it to every local-day helper below
+    preferences = get_or_create_preferences(user)
+    user_tz = get_preferences_timezone(preferences)
+    today = get_user_local_date(user, user_tz)  # Use user's local date, not UTC
 
     # Base querysets
     user_cards = Card.objects.filter(deck__owner=user)
     user_reviews = ReviewLog.objects.filter(card__deck__owner=user)
 
-    # Get deck statistics
-    decks = Deck.objects.filter(owner=user).annotate(
-        card_count=Count('cards'),
-        due_count=Count('cards', filter=Q(
-            cards__next_review__lte=now,
-            cards__has_been_reviewed=True  # Exclude new cards
+    # Get deck statistics, including each deck's maturity buckets
+    decks = Deck.objects.filter(owner=user).with_counts(now).annotate(
+        learning_count=Count('cards', filter=Q(
+            cards__has_been_reviewed=True, cards__interval__lt=21
         )),
-        new_count=Count('cards', filter=Q(cards__has_been_reviewed=False))
+        mature_count=Count('cards', filter=Q(cards__interval__gte=21)),
+    )
+
+    # Forecast day ranges (tomorrow onwards) in the user's local timezone
+    forecast_ranges = [
+        get_local_day_range(user, today + timedelta(days=i), user_tz) for i in range(1, 7)
+    ]
+
+    # Every card statistic below comes from this one aggregate query
+    reviewed = Q(has_been_reviewed=True)
+    card_stats = user_cards.aggregate(
+        total_cards=Count('pk'),
+        # Due = cards that have been reviewed before and are scheduled for review
+        total_due=Count('pk', filter=reviewed & Q(next_review__lte=now)),
+        # New = cards that have never been reviewed
+        total_new=Count('pk', filter=~reviewed),
+        # Practice mode: cards available for early review (reviewed but not yet due)
+        practice_available=Count('pk', filter=reviewed & Q(next_review__gt=now)),
+        # Next review time for "next review in X" display
+        next_review_time=Min('next_review', filter=reviewed & Q(next_review__gt=now)),
+        # Card status: Learning (interval < 21), Mature (interval >= 21)
+        cards_learning=Count('pk', filter=reviewed & Q(interval__lt=21)),
+        cards_mature=Count('pk', filter=Q(interval__gte=21)),
+        avg_ease=Avg('ease_factor'),
+        # Struggling cards (ease factor < 2.0 and has been reviewed)
+        struggling_cards=Count('pk', filter=reviewed & Q(ease_factor__lt=2.0)),
+        **{
+            f'due_day_{i}': Count('pk', filter=Q(next_review__gte=start, next_review__lt=end))
+            for i, (start, end) in enumerate(forecast_ranges, start=1)
+        },
     )
 
-    total_cards = user_cards.count()
-    # Due = cards that have been reviewed before and are scheduled for review
-    total_due = user_cards.filter(next_review__lte=now, has_been_reviewed=True).count()
-    # New = cards that have never been reviewed
-    total_new = user_cards.filter(has_been_reviewed=False).count()
-    
-    # Practice mode: cards available for early review (reviewed but not yet due)
-    practice_available = user_cards.filter(
-        next_review__gt=now,
-        has_been_reviewed=True
-    ).count()
-    
-    # Get next review time for "next review in X" display
-    next_review_card = user_cards.filter(
-        next_review__gt=now,
-        has_been_reviewed=True
-    ).order_by('next_review').first()
-    next_review_time = next_review_card.next_review if next_review_card else None
+    total_cards = card_stats['total_cards']
+    total_due = card_stats['total_due']
+    total_new = card_stats['total_new']
+    practice_available = card_stats['practice_available']
+    next_review_time = card_stats['next_review_time']
 
     # === PROGRESS STATS ===
     # Card status: New (never reviewed), Learning (interval < 21), Mature (interval >= 21)
-    cards_new = user_cards.filter(has_been_reviewed=False).count()
-    cards_learning = user_cards.filter(has_been_reviewed=True, interval__lt=21).count()
-    cards_mature = user_cards.filter(interval__gte=21).count()
+    cards_new = total_new
+    cards_learning = card_stats['cards_learning']
+    cards_mature = card_stats['cards_mature']
+
+    # Activity windows (using user's local timezone)
+    today_start, today_end = get_local_day_range(user, today, user_tz)
+    week_start = today - timedelta(days=today.weekday())
+    week_start_utc = get_local_day_start(user, week_start, user_tz)
+    month_start = today.replace(day=1)
+    month_start_utc = get_local_day_start(user, month_start, user_tz)
+    thirty_days_ago = today - timedelta(days=30)
+    thirty_days_ago_utc = get_local_day_start(user, thirty_days_ago, user_tz)
+
+    # Every review statistic below comes from this one aggregate query
+    correct = Q(quality__gte=3)
+    review_stats = user_reviews.aggregate(
+        total=Count('pk'),
+        correct=Count('pk', filter=correct),
+        today=Count('pk', filter=Q(reviewed_at__gte=today_start, reviewed_at__lt=today_end)),
+        week=Count('pk', filter=Q(reviewed_at__gte=week_start_utc)),
+        month=Count('pk', filter=Q(reviewed_at__gte=month_start_utc)),
+        last_30=Count('pk', filter=Q(reviewed_at__gte=thirty_days_ago_utc)),
+    )
 
     # Retention rate (% of reviews answered correctly - quality >= 3)
-    total_reviews_ever = user_reviews.count()
-    correct_reviews = user_reviews.filter(quality__gte=3).count()
+    total_reviews_ever = review_stats['total']
+    correct_reviews = review_stats['correct']
     retention_rate = round((correct_reviews / total_reviews_ever * 100) if total_reviews_ever > 0 else 0, 1)
 
     # Average ease factor
-    avg_ease = user_cards.aggregate(avg=Avg('ease_factor'))['avg'] or 2.5
+    avg_ease = card_stats['avg_ease'] or 2.5
 
-    # Struggling cards (ease factor < 2.0 and has been reviewed)
-    struggling_cards = user_cards.filter(ease_factor__lt=2.0, has_been_reviewed=True).count()
+    struggling_cards = card_stats['struggling_cards']
 
     # === ACTIVITY STATS ===
-    # Reviews today/this week/this month (using user's local timezone)
-    today_start, today_end = get_local_day_range(user, today)
-    reviews_today = user_reviews.filter(
-        reviewed_at__gte=today_start,
-        reviewed_at__lt=today_end
-    ).count()
-
-    week_start = today - timedelta(days=today.weekday())
-    week_start_utc = get_local_day_start(user, week_start)
-    reviews_this_week = user_reviews.filter(reviewed_at__gte=week_start_utc).count()
-
-    month_start = today.replace(day=1)
-    month_start_utc = get_local_day_start(user, month_start)
-    reviews_this_month = user_reviews.filter(reviewed_at__gte=month_start_utc).count()
+    # Reviews today/this week/this month
+    reviews_today = review_stats['today']
+    reviews_this_week = review_stats['week']
+    reviews_this_month = review_stats['month']
 
     # Average reviews per day (last 30 days)
-    thirty_days_ago = today - timedelta(days=30)
-    thirty_days_ago_utc = get_local_day_start(user, thirty_days_ago)
-    reviews_last_30 = user_reviews.filter(reviewed_at__gte=thirty_days_ago_utc).count()
+    reviews_last_30 = review_stats['last_30']
     avg_reviews_per_day = round(reviews_last_30 / 30, 1)
 
     # Study streak - use stored values from UserPreferences
     # These are updated when user completes reviews (see update_streak method)
-    preferences = get_or_create_preferences(user)
 
     # Check if streak is still valid (studied today or yesterday)
     # If user hasn't studied in more than 1 day, streak should be 0
@@ -117,12 +141,7 @@ def dashboard(request):
     longest_streak = preferences.longest_streak
 
     # === FORECAST STATS ===
-    tomorrow = today + timedelta(days=1)
-    tomorrow_start, tomorrow_end = get_local_day_range(user, tomorrow)
-    due_tomorrow = user_cards.filter(
-        next_review__gte=tomorrow_start,
-        next_review__lt=tomorrow_end
-    ).count()
+    due_tomorrow = card_stats['due_day_1']
 
     # Due in next 7 days (by day)
     forecast = []
@@ -132,8 +151,7 @@ def dashboard(request):
             # Today: cards currently due
             count = total_due
         else:
-            day_start, day_end = get_local_day_range(user, day)
-            count = user_cards.filter(next_review__gte=day_start, next_review__lt=day_end).count()
+            count = card_stats[f'due_day_{i}']
         forecast.append({
             'day': day,
             'day_name': 'Today' if i == 0 else ('Tomorrow' if i == 1 else day.strftime('%a')),
@@ -141,17 +159,23 @@ def dashboard(request):
         })
 
     # === PER-DECK STATS ===
+    # Review totals for every deck in one grouped query
+    deck_review_counts = {
+        row['card__deck']: row
+        for row in user_reviews.values('card__deck').annotate(
+            total=Count('pk'), correct=Count('pk', filter=correct)
+        ).order_by()
+    }
     deck_stats = []
     for deck in decks:
-        deck_reviews = user_reviews.filter(card__deck=deck)
-        deck_total_reviews = deck_reviews.count()
-        deck_correct = deck_reviews.filter(quality__gte=3).count()
+        deck_reviews = deck_review_counts.get(deck.pk, {'total': 0, 'correct': 0})
+        deck_total_reviews = deck_reviews['total']
+        deck_correct = deck_reviews['correct']
         deck_retention = round((deck_correct / deck_total_reviews * 100) if deck_total_reviews > 0 else 0, 1)
 
-        deck_cards = user_cards.filter(deck=deck)
-        deck_new = deck_cards.filter(has_been_reviewed=False).count()
-        deck_learning = deck_cards.filter(has_been_reviewed=True, interval__lt=21).count()
-        deck_mature = deck_cards.filter(interval__gte=21).count()
+        deck_new = deck.new_count
+        deck_learning = deck.learning_count
+        deck_mature = deck.mature_count
 
         deck_stats.append({
             'deck': deck,
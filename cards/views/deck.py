@@ -5,7 +5,8 @@ import json
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import Count, Q
+from django.db import transaction
+from django.db.models import Q
 from django.http import HttpResponse, JsonResponse
 from django.shortcuts import render, redirect, get_object_or_404
 from django.utils import timezone
@@ -16,6 +17,13 @@ from django.urls import reverse_lazy
 from ..models import Deck, Card
 from ..forms import DeckForm
 
+# Cards per INSERT when importing, keeping large decks under the database's
+# bound-parameter limit (Card has about a dozen columns)
+IMPORT_BATCH_SIZE = 1000
+
+# Card types accepted from deck files; anything else imports as basic
+IMPORT_CARD_TYPES = frozenset(Card.CardType.values)
+
 
 class DeckListView(LoginRequiredMixin, ListView):
     """List all decks for the current user."""
@@ -24,14 +32,7 @@ class DeckListView(LoginRequiredMixin, ListView):
     context_object_name = 'decks'
 
     def get_queryset(self):
-        now = timezone.now()
-        return Deck.objects.filter(owner=self.request.user).annotate(
-            card_count=Count('cards'),
-            due_count=Count('cards', filter=Q(
-                cards__next_review__lte=now,
-                cards__has_been_reviewed=True  # Exclude new cards
-            ))
-        )
+        return Deck.objects.filter(owner=self.request.user).with_counts()
 
 
 class DeckCreateView(LoginRequiredMixin, CreateView):
@@ -79,10 +80,11 @@ class DeckDeleteView(LoginRequiredMixin, DeleteView):
 @login_required
 def deck_detail(request, pk):
     """View deck details and cards."""
-    deck = get_object_or_404(Deck, pk=pk, owner=request.user)
-    cards = deck.cards.all()
     now = timezone.now()
-    due_count = cards.filter(next_review__lte=now, has_been_reviewed=True).count()
+    # Counts come back with the deck row instead of a separate COUNT query
+    deck = get_object_or_404(Deck.objects.with_counts(now), pk=pk, owner=request.user)
+    cards = deck.cards.all()
+    due_count = deck.due_count
 
     # Handle sorting
     sort = request.GET.get('sort', 'created')
@@ -94,7 +96,11 @@ def deck_detail(request, pk):
         'interval': '-interval',
     }
     order_by = sort_options.get(sort, 'pk')
-    cards = cards.order_by(order_by)
+    # Flag due cards in SQL with the same `now` as due_count, so the badges
+    # agree with the header count and the template needs no per-card call
+    cards = cards.annotate(
+        due=Q(next_review__lte=now, has_been_reviewed=True)
+    ).order_by(order_by)
 
     context = {
         'deck': deck,
@@ -157,6 +163,10 @@ def deck_import(request):
             return redirect('deck_list')
 
         # Validate required fields
+        if not isinstance(data, dict):
+            messages.error(request, 'Invalid deck file: expected a JSON object.')
+            return redirect('deck_list')
+
         if 'name' not in data:
             messages.error(request, 'Invalid deck file: missing "name" field.')
             return redirect('deck_list')
@@ -167,40 +177,46 @@ def deck_import(request):
 
         # Check for duplicate deck name
         deck_name = data['name']
-        if Deck.objects.filter(name=deck_name, owner=request.user).exists():
+        # Fetch every name the numbered variants could collide with at once
+        taken = set(Deck.objects.filter(
+            owner=request.user, name__startswith=deck_name
+        ).values_list('name', flat=True))
+        if deck_name in taken:
             # Append number to make unique
             counter = 1
-            while Deck.objects.filter(name=f"{deck_name} ({counter})", owner=request.user).exists():
+            while f"{deck_name} ({counter})" in taken:
                 counter += 1
             deck_name = f"{deck_name} ({counter})"
 
-        # Create deck
-        deck = Deck.objects.create(
-            name=deck_name,
-            description=data.get('description', ''),
-            owner=request.user
-        )
-
-        # Create cards
-        valid_card_types = [choice[0] for choice in Card.CardType.choices]
-        cards_created = 0
+        # Build the cards up front, then write deck and cards together
+        cards = []
 
         for card_data in data['cards']:
             if 'front' not in card_data:
                 continue  # Skip invalid cards
 
             card_type = card_data.get('card_type', 'basic')
-            if card_type not in valid_card_types:
-                card_type = 'basic'
+            if not isinstance(card_type, str) or card_type not in IMPORT_CARD_TYPES:
+                card_type = Card.CardType.BASIC
 
-            Card.objects.create(
-                deck=deck,
+            cards.append(Card(
                 card_type=card_type,
                 front=card_data['front'],
                 back=card_data.get('back', ''),
                 notes=card_data.get('notes', '')
+            ))
+
+        # One INSERT for all cards; a failure leaves no half-imported deck
+        with transaction.atomic():
+            deck = Deck.objects.create(
+                name=deck_name,
+                description=data.get('description', ''),
+                owner=request.user
             )
-            cards_created += 1
+            for card in cards:
+                card.deck = deck
+            Card.objects.bulk_create(cards, batch_size=IMPORT_BATCH_SIZE)
+        cards_created = len(cards)
 
         messages.success(request, f'Imported deck "{deck_name}" with {cards_created} cards!')
         return redirect('deck_detail', pk=deck.pk)
@@ -14,14 +14,28 @@ def get_or_create_preferences(user):
     return preferences
 
 
-def get_user_local_date(user):
-    """Get the current date in the user's timezone."""
-    preferences = get_or_create_preferences(user)
-    user_tz = zoneinfo.ZoneInfo(preferences.user_timezone)
+def get_preferences_timezone(preferences):
+    """Get the timezone of an already-loaded UserPreferences as a ZoneInfo."""
+    return zoneinfo.ZoneInfo(preferences.user_timezone)
+
+
+def get_user_timezone(user):
+    """Get the user's timezone as a ZoneInfo."""
+    return get_preferences_timezone(get_or_create_preferences(user))
+
+
+def get_user_local_date(user, user_tz=None):
+    """
+    Get the current date in the user's timezone.
+
+    Pass `user_tz` when the caller already has it to skip the preferences lookup.
+    """
+    if user_tz is None:
+        user_tz = get_user_timezone(user)
     return timezone.now().astimezone(user_tz).date()
 
 
-def get_local_day_range(user, date):
+def get_local_day_range(user, date, user_tz=None):
     """
     Get the UTC datetime range for a given local date in the user's timezone.
 
@@ -30,9 +44,10 @@ def get_local_day_range(user, date):
     - end_utc is midnight of the next day in user's timezone, converted to UTC
 
     Use with: queryset.filter(reviewed_at__gte=start_utc, reviewed_at__lt=end_utc)
+    Pass `user_tz` when the caller already has it to skip the preferences lookup.
     """
-    preferences = get_or_create_preferences(user)
-    user_tz = zoneinfo.ZoneInfo(preferences.user_timezone)
+    if user_tz is None:
+        user_tz = get_user_timezone(user)
 
     # Create midnight datetime in user's timezone
     local_start = datetime.combine(date, time.min, tzinfo=user_tz)
@@ -42,13 +57,14 @@ def get_local_day_range(user, date):
     return (local_start.astimezone(dt_timezone.utc), local_end.astimezone(dt_timezone.utc))
 
 
-def get_local_day_start(user, date):
+def get_local_day_start(user, date, user_tz=None):
     """
     Get the UTC datetime for midnight of a given local date in the user's timezone.
 
     Use with: queryset.filter(reviewed_at__gte=start_utc) for "on or after this date"
+    Pass `user_tz` when the caller already has it to skip the preferences lookup.
     """
-    preferences = get_or_create_preferences(user)
-    user_tz = zoneinfo.ZoneInfo(preferences.user_timezone)
+    if user_tz is None:
+        user_tz = get_user_timezone(user)
     local_start = datetime.combine(date, time.min, tzinfo=user_tz)
     return local_start.astimezone(dt_timezone.utc)
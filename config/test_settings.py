@@ -0,0 +1,47 @@
+"""
+Settings for the test suite.
+
+manage.py selects this module for `manage.py test`; everything else comes
+from the regular settings.
+"""
+
+from .settings import *  # noqa: F401,F403
+
+# Tests create users constantly; the default PBKDF2 hasher is deliberately
+# slow and dominates fixture setup. MD5 is fine for throwaway test passwords.
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+# Keep the test database in memory even if the file-based default changes;
+# `manage.py test --parallel` gives each worker its own in-memory copy.
+DATABASES = {
+    'default': {**DATABASES['default'], 'TEST': {'NAME': ':memory:'}},  # noqa: F405
+}
+
+# Nothing is collected into STATIC_ROOT for tests, so WhiteNoise has nothing
+# to serve; skip its per-client setup. The rest of the stack stays so views
+# are tested behind the same session/CSRF/auth/messages middleware.
+MIDDLEWARE = [
+    m for m in MIDDLEWARE  # noqa: F405
+    if m != 'whitenoise.middleware.WhiteNoiseMiddleware'
+]
+
+# Keep test runs off the console and out of logs/*.log. Tests that care
+# about a message can still capture it with assertLogs().
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'null': {'class': 'logging.NullHandler'},
+    },
+    'loggers': {
+        'django': {'handlers': ['null'], 'propagate': False},
+        'cards': {'handlers': ['null'], 'propagate': False},
+    },
+    'root': {'handlers': ['null']},
+}
+
+# Build the test schema straight from the models instead of replaying every
+# migration. CI still runs `makemigrations --check` to catch model drift.
+MIGRATION_MODULES = {'cards': None}
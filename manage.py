@@ -6,6 +6,9 @@ import sys
 
 def main():
     """Run administrative tasks."""
+    # `manage.py test` runs against the test settings unless told otherwise
+    if sys.argv[1:2] == ['test']:
+        os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.test_settings')
     os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
     try:
         from django.core.management import execute_from_command_line